@@ -0,0 +1,132 @@
+"""
+Remember which remote GRIB2 and index files exist.
+
+Herbie sends a HEAD request to each source to find a GRIB2 file and its
+index file every time a Herbie object is made. The results are kept in
+a small SQLite database in the ``save_dir`` so that making the same
+Herbie object again doesn't need to ask the remote servers again.
+
+- A file that exists is checked again after a week, because archives
+  like Pando remove old files, or after a day for NOMADS, which only
+  keeps recent data. If downloading a file fails, it is forgotten so it
+  is looked for again.
+- A file that doesn't exist is checked again after an hour because it
+  might not have been uploaded yet, or after 10 minutes if it is from a
+  recent model run that is likely still being uploaded.
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from herbie import Path, config
+
+# Seconds before a cached result is checked again (None is never).
+TTL_FOUND = 7 * 24 * 60 * 60
+TTL_FOUND_NOMADS = 24 * 60 * 60
+TTL_NOT_FOUND = 60 * 60
+TTL_NOT_FOUND_RECENT = 10 * 60
+
+_lock = threading.Lock()
+_connection = None
+
+
+def cache_file() -> Path:
+    """Path of the SQLite database."""
+    return Path(config["default"]["save_dir"]).expand() / ".herbie_probe_cache.sqlite"
+
+
+def _connect() -> Optional[sqlite3.Connection]:
+    """Open the database once; None if it can't be opened."""
+    global _connection
+    if _connection is None:
+        try:
+            path = cache_file()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            con = sqlite3.connect(path, check_same_thread=False, timeout=10)
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute(
+                "CREATE TABLE IF NOT EXISTS probe"
+                " (url TEXT PRIMARY KEY, found INTEGER, checked_at REAL)"
+            )
+            _connection = con
+        except (OSError, sqlite3.Error):
+            # Don't cache if the save_dir isn't writable.
+            _connection = False
+    return _connection or None
+
+
+def _ttl(url: str, found: bool, recent: bool = False) -> Optional[float]:
+    """Seconds a result is valid."""
+    if not found:
+        return TTL_NOT_FOUND_RECENT if recent else TTL_NOT_FOUND
+    if "nomads" in url:
+        return TTL_FOUND_NOMADS
+    return TTL_FOUND
+
+
+def get(url: str, recent: bool = False) -> Optional[bool]:
+    """Return if the URL exists, or None if it isn't cached or is expired.
+
+    Set ``recent`` for files from a recent model run so a file that
+    didn't exist is checked again sooner.
+    """
+    with _lock:
+        con = _connect()
+        if con is None:
+            return None
+        try:
+            row = con.execute(
+                "SELECT found, checked_at FROM probe WHERE url = ?", (url,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+
+    if row is None:
+        return None
+
+    found, checked_at = bool(row[0]), row[1]
+    ttl = _ttl(url, found, recent)
+    if ttl is not None and time.time() - checked_at > ttl:
+        return None
+    return found
+
+
+def put(url: str, found: bool) -> None:
+    """Remember if the URL exists."""
+    with _lock:
+        con = _connect()
+        if con is None:
+            return
+        try:
+            with con:
+                con.execute(
+                    "INSERT OR REPLACE INTO probe VALUES (?, ?, ?)",
+                    (url, int(found), time.time()),
+                )
+        except sqlite3.Error:
+            pass
+
+
+def forget(url: str) -> None:
+    """Forget the cached result for the URL."""
+    with _lock:
+        con = _connect()
+        if con is None:
+            return
+        try:
+            with con:
+                con.execute("DELETE FROM probe WHERE url = ?", (url,))
+        except sqlite3.Error:
+            pass
+
+
+def clear() -> None:
+    """Forget all cached results."""
+    with _lock:
+        con = _connect()
+        if con is None:
+            return
+        with con:
+            con.execute("DELETE FROM probe")
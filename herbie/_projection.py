@@ -0,0 +1,124 @@
+"""
+Get the grid projection of GRIB2 data opened with cfgrib.
+
+cfgrib doesn't give the grid projection as CF grid mapping attributes
+(https://github.com/ecmwf/cfgrib/issues/251). Instead of opening the
+file again with pygrib, the projection is built from the GRIB keys
+cfgrib attaches to each variable. The keys in ``READ_KEYS`` must be
+given to cfgrib's ``read_keys`` for this to work.
+"""
+
+import functools
+from typing import Optional
+
+import xarray as xr
+
+# GRIB keys needed to build the grid projection.
+READ_KEYS = [
+    "gridType",
+    "shapeOfTheEarth",
+    "scaleFactorOfRadiusOfSphericalEarth",
+    "scaledValueOfRadiusOfSphericalEarth",
+    "LaDInDegrees",
+    "LoVInDegrees",
+    "Latin1InDegrees",
+    "Latin2InDegrees",
+    "orientationOfTheGridInDegrees",
+    "projectionCentreFlag",
+    "longitudeOfFirstGridPointInDegrees",
+    "longitudeOfLastGridPointInDegrees",
+]
+
+# Earth radius (a, b) in meters for GRIB2 `shapeOfTheEarth` codes.
+# Code 1 is a sphere with the radius given in the file.
+# https://codes.ecmwf.int/grib/format/grib2/ctables/3/2/
+_grib_earth_shape = {
+    0: (6367470.0, 6367470.0),
+    4: (6378137.0, 6356752.314),
+    5: (6378137.0, 6356752.3142),
+    6: (6371229.0, 6371229.0),
+    8: (6371200.0, 6371200.0),
+}
+
+
+def projparams_from_grib_attrs(ds: xr.Dataset) -> Optional[dict]:
+    """Build PROJ parameters from the GRIB keys cfgrib attached to variables.
+
+    This is the same as pygrib's ``projparams``, but doesn't need to
+    open the GRIB file again. Returns None if the grid type isn't
+    supported or if a key is missing (the key must be in cfgrib's
+    ``read_keys``; e.g., ``shapeOfTheEarth`` is not read by default).
+    """
+    attrs = next(
+        (ds[v].attrs for v in ds.data_vars if "GRIB_gridType" in ds[v].attrs), None
+    )
+    if attrs is None:
+        return None
+
+    grid_type = attrs["GRIB_gridType"]
+
+    try:
+        if attrs["GRIB_shapeOfTheEarth"] == 1:
+            a = b = (
+                attrs["GRIB_scaledValueOfRadiusOfSphericalEarth"]
+                / 10 ** attrs["GRIB_scaleFactorOfRadiusOfSphericalEarth"]
+            )
+        elif attrs["GRIB_shapeOfTheEarth"] in _grib_earth_shape:
+            a, b = _grib_earth_shape[attrs["GRIB_shapeOfTheEarth"]]
+        else:
+            return None
+
+        if grid_type == "lambert":
+            projparams = dict(
+                proj="lcc",
+                lon_0=attrs["GRIB_LoVInDegrees"],
+                lat_0=attrs["GRIB_LaDInDegrees"],
+                lat_1=attrs["GRIB_Latin1InDegrees"],
+                lat_2=attrs["GRIB_Latin2InDegrees"],
+            )
+        elif grid_type == "polar_stereographic":
+            projparams = dict(
+                proj="stere",
+                lat_ts=attrs["GRIB_LaDInDegrees"],
+                lat_0=-90 if attrs["GRIB_projectionCentreFlag"] & 128 else 90,
+                lon_0=attrs["GRIB_orientationOfTheGridInDegrees"],
+            )
+        elif grid_type == "mercator":
+            projparams = dict(
+                proj="merc",
+                lat_ts=attrs["GRIB_LaDInDegrees"],
+                lon_0=0.5
+                * (
+                    attrs["GRIB_longitudeOfFirstGridPointInDegrees"]
+                    + attrs["GRIB_longitudeOfLastGridPointInDegrees"]
+                ),
+            )
+        elif grid_type == "regular_ll":
+            projparams = dict(proj="longlat")
+        else:
+            return None
+    except KeyError:
+        return None
+
+    return dict(a=a, b=b, **projparams)
+
+
+def cf_params(projparams: dict) -> dict:
+    """CF grid mapping attributes for the PROJ parameters."""
+    return dict(_cf_params(tuple(sorted(projparams.items()))))
+
+
+@functools.lru_cache(maxsize=64)
+def _cf_params(projparams: tuple) -> dict:
+    """Cached ``cf_params``; every file from a model usually has the same grid."""
+    from pyproj import CRS
+
+    projparams = dict(projparams)
+    cf_params = CRS(projparams).to_cf()
+
+    # Funny stuff with polar stereographic (https://github.com/pyproj4/pyproj/issues/856)
+    if cf_params["grid_mapping_name"] == "polar_stereographic":
+        cf_params["latitude_of_projection_origin"] = cf_params.get(
+            "latitude_of_projection_origin", projparams.get("lat_0", 90)
+        )
+    return cf_params
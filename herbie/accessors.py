@@ -10,19 +10,24 @@ Other useful packages
 """
 
 import functools
+import logging
+import os
 import pickle
 import re
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Literal, Optional, Union
 
 import numpy as np
 import pandas as pd
-import pygrib
 import xarray as xr
-from pyproj import CRS
+from pyproj import CRS, Transformer
 
 import herbie
+from herbie import _projection
+
+log = logging.getLogger(__name__)
 
 _level_units = dict(
     adiabaticCondensation="adiabatic condensation",
@@ -53,25 +58,38 @@ _level_units = dict(
     surface="surface",
 )
 
+# Exponents in GRIB units (e.g., "m s**-1") as matplotlib superscripts.
+_units_exponent = re.compile(r"\*\*(-?\d+)")
+
+# Default number of neighbors `k` for each `pick_points` method.
+# - nearest : Get the value at the nearest grid point using BallTree.
+# - weighted: Compute the value of each variable from the inverse-
+#             weighted distance of the values of the four nearest
+#             neighbors.
+_pick_points_k = dict(
+    nearest=1,
+    weighted=4,
+)
+
 
 def add_proj_info(ds: xr.Dataset):
     """Add projection info to a Dataset."""
-    match = re.search(r'"source": "(.*?)"', ds.history)
-    FILE = Path(match.group(1))
-
-    # Get CF grid projection information with pygrib and pyproj because
-    # this is something cfgrib doesn't do (https://github.com/ecmwf/cfgrib/issues/251)
+    # Get CF grid projection information with pyproj because this is
+    # something cfgrib doesn't do (https://github.com/ecmwf/cfgrib/issues/251)
     # NOTE: Assumes the projection is the same for all variables
-    with pygrib.open(str(FILE)) as grb:
-        msg = grb.message(1)
-        cf_params = CRS(msg.projparams).to_cf()
-
-    # Funny stuff with polar stereographic (https://github.com/pyproj4/pyproj/issues/856)
-    # TODO: Is there a better way to handle this? What about south pole?
-    if cf_params["grid_mapping_name"] == "polar_stereographic":
-        cf_params["latitude_of_projection_origin"] = cf_params.get(
-            "latitude_of_projection_origin", 90
-        )
+    projparams = _projection.projparams_from_grib_attrs(ds)
+
+    if projparams is None:
+        # Read the projection from the GRIB file with pygrib instead.
+        import pygrib
+
+        match = re.search(r'"source": "(.*?)"', ds.history)
+        FILE = Path(match.group(1))
+        log.debug(f"Reading the grid projection of {FILE} with pygrib.")
+        with pygrib.open(str(FILE)) as grb:
+            projparams = grb.message(1).projparams
+
+    cf_params = _projection.cf_params(projparams)
 
     # ----------------------
     # Attach CF grid mapping
@@ -82,15 +100,80 @@ def add_proj_info(ds: xr.Dataset):
     ds["gribfile_projection"].attrs["long_name"] = "model grid projection"
 
     # Assign this grid_mapping for all variables
-    for var in list(ds):
+    for var in ds.data_vars:
         if var == "gribfile_projection":
             continue
         ds[var].attrs["grid_mapping"] = "gribfile_projection"
 
 
-@xr.register_dataset_accessor("herbie")
+def _haversine(lat1, lon1, lat2, lon2):
+    """Great-circle distance (km) between points in degrees."""
+    lat1, lon1, lat2, lon2 = map(np.deg2rad, (lat1, lon1, lat2, lon2))
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * 6371 * np.arcsin(np.sqrt(a))
+
+
+def _nearest_regular_latlon(grid_lat, grid_lon, lat, lon):
+    """Find the nearest grid point on a regular latitude-longitude grid.
+
+    The two grid latitudes and two grid longitudes bracketing each point
+    are found with a binary search, and the closest of those four grid
+    points is chosen by great-circle distance.
+
+    Parameters
+    ----------
+    grid_lat, grid_lon : 1D array
+        The grid's latitude and longitude coordinates.
+    lat, lon : 1D array
+        Latitude and longitude of the requested points.
+
+    Returns
+    -------
+    The latitude index, longitude index, and distance (km) to the
+    nearest grid point for each point.
+    """
+
+    def _bracket(grid, values, periodic=False):
+        order = np.argsort(grid)
+        i = np.searchsorted(grid[order], values)
+        i = np.stack([i - 1, i])
+        if periodic:
+            i %= len(grid)
+        else:
+            i = np.clip(i, 0, len(grid) - 1)
+        return order[i]
+
+    # Put the point longitudes in the same range as the grid longitudes.
+    # A global grid wraps around, so a point past its last longitude is
+    # between the last and first longitude. A regional grid doesn't, so
+    # center the points on the grid; points outside it are then closest
+    # to the edge they are next to, not the opposite one.
+    lon_min, lon_max = grid_lon.min(), grid_lon.max()
+    spacing = np.abs(np.diff(grid_lon)).min() if len(grid_lon) > 1 else 0
+    periodic = np.isclose(lon_max - lon_min + spacing, 360)
+    if periodic:
+        lon = (lon - lon_min) % 360 + lon_min
+    else:
+        center = (lon_min + lon_max) / 2
+        lon = (lon - center + 180) % 360 + center - 180
+
+    iy = np.repeat(_bracket(grid_lat, lat), 2, axis=0)
+    ix = np.tile(_bracket(grid_lon, lon, periodic), (2, 1))
+
+    dist = _haversine(lat, lon, grid_lat[iy], grid_lon[ix])
+    nearest = dist.argmin(axis=0), np.arange(len(lat))
+    return iy[nearest], ix[nearest], dist[nearest]
+
+
 class HerbieAccessor:
-    """Accessor for xarray Datasets opened with Herbie."""
+    """Accessor for xarray Datasets opened with Herbie.
+
+    It is registered as ``ds.herbie`` by :mod:`herbie.core`, which only
+    imports this module the first time the accessor is used.
+    """
 
     def __init__(self, xarray_obj):
         self._obj = xarray_obj
@@ -102,8 +185,8 @@ class HerbieAccessor:
         if self._center is None:
             # we can use a cache on our accessor objects, because accessors
             # themselves are cached on instances that access them.
-            lon = self._obj.latitude
-            lat = self._obj.longitude
+            lon = np.asarray(self._obj.longitude.data)
+            lat = np.asarray(self._obj.latitude.data)
             self._center = (float(lon.mean()), float(lat.mean()))
         return self._center
 
@@ -119,6 +202,11 @@ class HerbieAccessor:
         ds["longitude"] = (ds["longitude"] - 360) % 360
         return ds
 
+    @functools.cached_property
+    def _data_vars(self) -> list[str]:
+        """Names of the data variables that have dimensions."""
+        return [v for v, da in self._obj.data_vars.items() if da.ndim > 0]
+
     @functools.cached_property
     def crs(self):
         """
@@ -142,26 +230,21 @@ class HerbieAccessor:
 
         ds = self._obj
 
-        # Get variables that have dimensions
+        # Only variables that have dimensions
         # (this filters out the gribfile_projection variable)
-        variables = [i for i in list(ds) if len(ds[i].dims) > 0]
-
-        ds = ds.metpy.parse_cf(varname=variables)
+        ds = ds.metpy.parse_cf(varname=self._data_vars)
         crs = ds.metpy_crs.item().to_cartopy()
         return crs
 
     @functools.cached_property
-    def polygon(self):
-        """Get a polygon of the domain boundary."""
-        try:
-            import cartopy.crs as ccrs
-            from shapely.geometry import Polygon
-        except ModuleNotFoundError:
-            raise ModuleNotFoundError(
-                "cartopy is an 'extra' requirements, please use "
-                "`pip install 'herbie-data[extras]'` for the full functionality."
-            )
+    def _to_crs_transformer(self) -> Transformer:
+        """Transformer from longitude/latitude to the dataset's projection."""
+        crs = CRS.from_user_input(self.crs)
+        return Transformer.from_crs(crs.geodetic_crs, crs, always_xy=True)
 
+    @functools.cached_property
+    def _polygon_outside(self) -> np.ndarray:
+        """Longitude/latitude of the grid points along the domain border."""
         ds = self._obj
 
         LON = ds.longitude.data
@@ -169,31 +252,56 @@ class HerbieAccessor:
 
         # Path of array outside border starting from the lower left corner
         # and going around the array counter-clockwise.
-        outside = (
-            list(zip(LON[0, :], LAT[0, :]))
-            + list(zip(LON[:, -1], LAT[:, -1]))
-            + list(zip(LON[-1, ::-1], LAT[-1, ::-1]))
-            + list(zip(LON[::-1, 0], LAT[::-1, 0]))
+        return np.column_stack(
+            [
+                np.concatenate([LON[0, :], LON[:, -1], LON[-1, ::-1], LON[::-1, 0]]),
+                np.concatenate([LAT[0, :], LAT[:, -1], LAT[-1, ::-1], LAT[::-1, 0]]),
+            ]
         )
-        outside = np.array(outside)
 
-        ###############################
-        # Polygon in Lat/Lon coordinates
-        x = outside[:, 0]
-        y = outside[:, 1]
-        domain_polygon_latlon = Polygon(zip(x, y))
+    @functools.cached_property
+    def polygon_latlon(self):
+        """Get a polygon of the domain boundary in lat/lon coordinates."""
+        try:
+            import shapely
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError(
+                "shapely is an 'extra' requirements, please use "
+                "`pip install 'herbie-data[extras]'` for the full functionality."
+            )
 
-        ###################################
-        # Polygon in projection coordinates
-        transform = self.crs.transform_points(ccrs.PlateCarree(), x, y)
+        return shapely.polygons(self._polygon_outside)
+
+    @functools.cached_property
+    def polygon_proj(self):
+        """Get a polygon of the domain boundary in projection coordinates."""
+        try:
+            import shapely
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError(
+                "shapely is an 'extra' requirements, please use "
+                "`pip install 'herbie-data[extras]'` for the full functionality."
+            )
+
+        x = self._polygon_outside[:, 0]
+        y = self._polygon_outside[:, 1]
+        xy = np.column_stack(self._to_crs_transformer.transform(x, y))
 
         # Remove any points that run off the projection map (i.e., point's value is `inf`).
-        transform = transform[~np.isinf(transform).any(axis=1)]
-        x = transform[:, 0]
-        y = transform[:, 1]
-        domain_polygon = Polygon(zip(x, y))
+        return shapely.polygons(xy[np.isfinite(xy).all(axis=1)])
 
-        return domain_polygon, domain_polygon_latlon
+    @property
+    def polygon(self):
+        """Get polygons of the domain boundary.
+
+        Returns
+        -------
+        (domain_polygon, domain_polygon_latlon)
+            The domain boundary in projection coordinates and in lat/lon
+            coordinates. Use ``polygon_proj`` or ``polygon_latlon`` to
+            compute only one of them.
+        """
+        return self.polygon_proj, self.polygon_latlon
 
     def with_wind(
         self, which: Literal["both", "speed", "direction"] = "both"
@@ -313,6 +421,7 @@ class HerbieAccessor:
         max_distance: Union[int, float] = 500,
         use_cached_tree: Union[bool, Literal["replant"]] = True,
         tree_name: Optional[str] = None,
+        max_threads: Optional[int] = None,
         verbose: bool = False,
     ) -> xr.Dataset:
         """Pick nearest neighbor grid values at selected  points.
@@ -342,11 +451,15 @@ class HerbieAccessor:
             - `True` : Plant+save BallTree if it doesn't exist; load
                 saved BallTree if one exists.
             - `False`: Plant the BallTree, even if one exists.
-            - `"replant"` : Plant a new BallTree and save a new pickle.
+            - `"replant"` : Plant a new BallTree and save it.
         tree_name : str
             If None, use the ds.model and domain size as the tree's name.
             If ds.model does not exists, then the BallTree will not be
             cached, unless you provide the tree_name.
+        max_threads : None or int
+            Maximum number of threads used to query the BallTree when
+            there are more than 10,000 points. If None, use the number
+            of CPUs. Set to 1 to always query in a single thread.
 
         Examples
         --------
@@ -378,6 +491,7 @@ class HerbieAccessor:
         >>> dsp = dsp.swap_dims({"point": "point_stid"})
         """
         try:
+            import joblib
             from sklearn.neighbors import BallTree
         except ModuleNotFoundError:
             raise ModuleNotFoundError(
@@ -385,22 +499,26 @@ class HerbieAccessor:
                 "`pip install 'herbie-data[extras]'` for the full functionality."
             )
 
-        def plant_tree(save_pickle: Optional[Union[Path, str]] = None):
+        def plant_tree(save_file: Optional[Union[Path, str]] = None):
             """Grow a new BallTree object from seedling."""
+            # Flattened lat/lon grid; order matters and must be in radians.
+            grid = np.deg2rad(
+                np.column_stack([grid_lat.data.ravel(), grid_lon.data.ravel()])
+            )
+
             timer = pd.Timestamp("now")
             print("INFO: 🌱 Growing new BallTree...", end="")
-            tree = BallTree(np.deg2rad(df_grid), metric="haversine")
+            tree = BallTree(grid, metric="haversine")
             print(
                 f"🌳 BallTree grew in {(pd.Timestamp('now')-timer).total_seconds():.2} seconds."
             )
-            if save_pickle:
+            if save_file:
                 try:
-                    Path(save_pickle).parent.mkdir(parents=True, exist_ok=True)
-                    with open(save_pickle, "wb") as f:
-                        pickle.dump(tree, f)
-                    print(f"INFO: Saved BallTree to {save_pickle}")
+                    Path(save_file).parent.mkdir(parents=True, exist_ok=True)
+                    joblib.dump(tree, save_file)
+                    print(f"INFO: Saved BallTree to {save_file}")
                 except OSError:
-                    print(f"ERROR: Could not save BallTree to {save_pickle}.")
+                    print(f"ERROR: Could not save BallTree to {save_file}.")
             return tree
 
         ds = self._obj
@@ -421,27 +539,16 @@ class HerbieAccessor:
 
         # ---------------------
         # Validate method input
-        _method = set(["nearest", "weighted"])
-
-        if method == "nearest" and k is None:
-            # Get the value at the nearest grid point using BallTree
-            k = 1
-        elif method == "weighted" and k is None:
-            # Compute the value of each variable from the inverse-
-            # weighted distance of the values of the four nearest
-            # neighbors.
-            k = 4
-        elif method in _method and isinstance(k, int):
-            # Get the k nearest neighbors and return the values (nearest)
-            # or compute the distance-weighted mean (weighted).
-            pass
-        else:
+        if method not in _pick_points_k or not isinstance(k, (int, type(None))):
             raise ValueError(
-                f"`method` must be one of {_method} and `k` must be an int or None."
+                f"`method` must be one of {set(_pick_points_k)} and `k` must be an int or None."
             )
 
+        if k is None:
+            k = _pick_points_k[method]
+
         # Only consider variables that have dimensions.
-        ds = ds[[i for i in ds if ds[i].dims != ()]]
+        ds = ds[self._data_vars]
 
         if "latitude" in ds.dims and "longitude" in ds.dims:
             # Rename dims to x and y
@@ -449,127 +556,161 @@ class HerbieAccessor:
             # GFS and IFS model data.
             ds = ds.rename_dims({"latitude": "y", "longitude": "x"})
 
-        # Get Dataset's lat/lon grid and coordinate indices as a DataFrame.
-        df_grid = (
-            ds[["latitude", "longitude"]]
-            .drop_vars([i for i, j in ds.coords.items() if not j.ndim])
-            .to_dataframe()
-        )
+        if k == 1 and ds.latitude.dims == ("y",) and ds.longitude.dims == ("x",):
+            # The nearest grid point of a regular latitude-longitude
+            # grid is found with a binary search of the 1D coordinates,
+            # so we don't need a BallTree.
+            y_grid, x_grid, dist = _nearest_regular_latlon(
+                ds.latitude.to_numpy(),
+                ds.longitude.to_numpy(),
+                points.latitude.to_numpy(),
+                points.longitude.to_numpy(),
+            )
+            y_grid, x_grid, dist = y_grid[None], x_grid[None], dist[None]
+        else:
+            # The 2D lat/lon grid, also for regular lat/lon grids with
+            # 1D coordinates (broadcasting doesn't copy the data).
+            grid_lat, grid_lon = xr.broadcast(ds.latitude, ds.longitude)
+
+            # ---------------
+            # BallTree object
+            # Plant, plant+Save, or load
+
+            if tree_name is None:
+                tree_name = getattr(ds, "model", "UNKNOWN")
+
+            if use_cached_tree and tree_name == "UNKNOWN":
+                use_cached_tree = False
+                print(
+                    "WARNING: Herbie won't cache the BallTree because it\n"
+                    "         doesn't know what to name it. Please specify\n"
+                    "         `tree_name` to cache the tree for use later."
+                )
 
-        # ---------------
-        # BallTree object
-        # Plant, plant+Save, or load
+            # The BallTree is saved with joblib, which stores its arrays so
+            # they can be memory-mapped when loaded instead of unpickled.
+            BallTree_file = (
+                herbie.config["default"]["save_dir"]
+                / "BallTree"
+                / f"{tree_name}_{ds.x.size}-{ds.y.size}.joblib"
+            )
+            # BallTrees cached by older versions of Herbie were pickled.
+            pkl_BallTree_file = BallTree_file.with_suffix(".pkl")
+
+            if not use_cached_tree:
+                # Create a new BallTree. Do not save it.
+                tree = plant_tree(save_file=False)
+            elif use_cached_tree == "replant" or not (
+                BallTree_file.exists() or pkl_BallTree_file.exists()
+            ):
+                # Create a new BallTree and save it.
+                tree = plant_tree(save_file=BallTree_file)
+            elif BallTree_file.exists():
+                # Load saved BallTree.
+                tree = joblib.load(BallTree_file, mmap_mode="r")
+            else:
+                # Load BallTree from pickle.
+                with open(pkl_BallTree_file, "rb") as f:
+                    tree = pickle.load(f)
+
+            # -------------------------------------
+            # Query points to find nearest neighbor
+            # Note: Order matters, and lat/long must be in radians.
+            query_points = np.deg2rad(points[["latitude", "longitude"]].to_numpy())
+            threads = min(
+                max_threads or os.cpu_count() or 1, len(query_points) // 10_000
+            )
+            if threads > 1:
+                # The BallTree query releases the GIL, so many points can be
+                # split into chunks and queried in parallel.
+                with ThreadPoolExecutor(threads) as exe:
+                    results = list(
+                        exe.map(
+                            functools.partial(tree.query, k=k),
+                            np.array_split(query_points, threads),
+                        )
+                    )
+                dist = np.concatenate([r[0] for r in results])
+                ind = np.concatenate([r[1] for r in results])
+            else:
+                dist, ind = tree.query(query_points, k=k)
 
-        if tree_name is None:
-            tree_name = getattr(ds, "model", "UNKNOWN")
+            # Convert distance to km by multiplying by the radius of the Earth
+            dist *= 6371
 
-        if use_cached_tree and tree_name == "UNKNOWN":
-            use_cached_tree = False
-            print(
-                "WARNING: Herbie won't cache the BallTree because it\n"
-                "         doesn't know what to name it. Please specify\n"
-                "         `tree_name` to cache the tree for use later."
+            # Grid indices of the k nearest neighbors, shape (k, point).
+            # The BallTree's data are the flattened lat/lon grid, so the
+            # grid indices are unraveled from the tree's row numbers and
+            # a cached tree doesn't need the grid to be rebuilt.
+            grid_index = dict(
+                zip(grid_lat.dims, np.unravel_index(ind.T, grid_lat.shape))
             )
+            x_grid, y_grid = grid_index["x"], grid_index["y"]
+            dist = dist.T
 
-        pkl_BallTree_file = (
-            herbie.config["default"]["save_dir"]
-            / "BallTree"
-            / f"{tree_name}_{ds.x.size}-{ds.y.size}.pkl"
-        )
+        a = points.reset_index(drop=True)
 
-        if not use_cached_tree:
-            # Create a new BallTree. Do not save pickle.
-            tree = plant_tree(save_pickle=False)
-        elif use_cached_tree == "replant" or not pkl_BallTree_file.exists():
-            # Create a new BallTree and save pickle.
-            tree = plant_tree(save_pickle=pkl_BallTree_file)
-        elif use_cached_tree:
-            # Load BallTree from pickle.
-            with open(pkl_BallTree_file, "rb") as f:
-                tree = pickle.load(f)
-
-        # -------------------------------------
-        # Query points to find nearest neighbor
-        # Note: Order matters, and lat/long must be in radians.
-        # TODO: Maybe add option to use MultiProcessing here, to split
-        # TODO:   the Dataset into chunks; or maybe not needed because
-        # TODO:   the method is fast enough without the added complexity.
-        dist, ind = tree.query(np.deg2rad(points[["latitude", "longitude"]]), k=k)
-
-        # Convert distance to km by multiplying by the radius of the Earth
-        dist *= 6371
-
-        # Pick grid values for each value of k
-        k_points = []
-        df_grid = df_grid.reset_index()
-        for i in range(k):
-            a = points.copy()
-            a["point_grid_distance"] = dist[:, i]
-            a["grid_index"] = ind[:, i]
-
-            a = pd.concat(
-                [
-                    a,
-                    df_grid.iloc[a.grid_index]
-                    .add_suffix("_grid")
-                    .reset_index(drop=True),
-                ],
-                axis=1,
-            )
-            a.index.name = "point"
-
-            if max_distance:
-                flagged = a.loc[a.point_grid_distance > max_distance]
-                a = a.loc[a.point_grid_distance <= max_distance]
-                if len(flagged):
-                    print(
-                        f"WARNING: {len(flagged)} points removed for exceeding {max_distance=} km threshold."
-                    )
-                    print(f"{flagged}")
-                    print("")
-
-            # Get corresponding values from xarray
-            # https://docs.xarray.dev/en/stable/user-guide/indexing.html#more-advanced-indexing
-            ds_points = ds.sel(
-                x=a.x_grid.to_xarray(),
-                y=a.y_grid.to_xarray(),
-            )
-            ds_points.coords["point_grid_distance"] = a.point_grid_distance.to_xarray()
-            ds_points["point_grid_distance"].attrs["long_name"] = (
-                "Distance between requested point and nearest grid point."
-            )
-            ds_points["point_grid_distance"].attrs["units"] = "km"
+        if max_distance:
+            keep = (dist <= max_distance).all(axis=0)
+            flagged = a.loc[~keep]
+            if len(flagged):
+                print(
+                    f"WARNING: {len(flagged)} points removed for exceeding {max_distance=} km threshold."
+                )
+                print(f"{flagged}")
+                print("")
+                a = a.loc[keep]
+                x_grid, y_grid, dist = x_grid[:, keep], y_grid[:, keep], dist[:, keep]
 
-            for i in points.columns:
-                ds_points.coords[f"point_{i}"] = a[i].to_xarray()
-                ds_points[f"point_{i}"].attrs["long_name"] = f"Requested grid point {i}"
+        # Get corresponding values from xarray for all k neighbors at once.
+        # New dimension k is the index of the n-th nearest neighbor.
+        # https://docs.xarray.dev/en/stable/user-guide/indexing.html#more-advanced-indexing
+        ds_points = ds.isel(
+            x=xr.DataArray(x_grid, dims=["k", "point"]),
+            y=xr.DataArray(y_grid, dims=["k", "point"]),
+        ).transpose("k", ...)
+        ds_points.coords["point_grid_distance"] = (["k", "point"], dist)
+        ds_points["point_grid_distance"].attrs["long_name"] = (
+            "Distance between requested point and nearest grid point."
+        )
+        ds_points["point_grid_distance"].attrs["units"] = "km"
 
-            k_points.append(ds_points.drop_vars("point"))
+        for col in points.columns:
+            ds_points.coords[f"point_{col}"] = ("point", a[col].to_numpy())
+            ds_points[f"point_{col}"].attrs["long_name"] = f"Requested grid point {col}"
 
         if method == "nearest" and k == 1:
-            return k_points[0]
+            return ds_points.isel(k=0)
 
         elif method == "nearest" and k > 1:
-            # New dimension k is the index of the n-th nearest neighbor
-            return xr.concat(k_points, dim="k")
+            return ds_points
 
         elif method == "weighted":
             # Compute the inverse-distance weighted mean for each
             # variable from the four nearest points.
-            b = xr.concat(k_points, dim="k")
+            b = ds_points
 
             # Note: clipping accounts for the "divide by zero" case when
             # the requested point is exactly the nearest grid point.
-            weights = (1 / b.point_grid_distance).clip(max=1e6)
-
-            # Compute weighted mean of variables
-            sum_of_weights = weights.sum(dim="k")
-            weighted_sum = (b * weights).sum(dim="k")
-
-            c = weighted_sum / sum_of_weights
-
-            # Include some coordinates that were dropped as a result of
-            # the line `weights.sum(dim='k')`.
+            with np.errstate(divide="ignore"):
+                weights = np.clip(1 / dist, None, 1e6)
+            sum_of_weights = weights.sum(axis=0)
+
+            # Compute weighted mean of variables with NumPy. The k and
+            # point axes are moved to the front of each variable's array
+            # so the weights broadcast over any extra dimensions (e.g.
+            # level) and are moved back afterwards.
+            c = b.drop_dims("k")
+            for var in b.data_vars:
+                da = b[var].transpose("k", ...)
+                p = da.dims.index("point")
+                values = np.moveaxis(da.to_numpy(), p, 1)
+                w = weights.reshape(weights.shape + (1,) * (values.ndim - 2))
+                mean = (values * w).sum(axis=0) / sum_of_weights.reshape(w.shape[1:])
+                c[var] = (da.dims[1:], np.moveaxis(mean, 0, p - 1), da.attrs)
+
+            # Include some coordinates that were dropped because they
+            # vary along the k dimension.
             c.coords["latitude"] = b.coords["latitude"]
             c.coords["longitude"] = b.coords["longitude"]
             c.coords["point_grid_distance"] = b.coords["point_grid_distance"]
@@ -618,7 +759,7 @@ class HerbieAccessor:
 
         """
         try:
-            import cartopy.crs as ccrs
+            import cartopy  # noqa: F401
             import shapely
             from shapely.geometry import MultiPoint, Point
         except ModuleNotFoundError:
@@ -680,14 +821,12 @@ class HerbieAccessor:
         # Convert the requested [(lon,lat), (lon,lat)] points to map projection.
         # Accept a list of point tuples, or Shapely Points object.
         # We want to index the dataset at a single point.
-        # We can do this by transforming a lat/lon point to the grid location
-        crs = ds.metpy_crs.item().to_cartopy()
-
-        transformed_data = crs.transform_points(
-            ccrs.PlateCarree(), point_df.longitude, point_df.latitude
+        # We can do this by transforming a lat/lon point to the grid location.
+        xy = self._to_crs_transformer.transform(
+            point_df.longitude.to_numpy(), point_df.latitude.to_numpy()
         )
 
-        a = pd.DataFrame({"x": transformed_data[:, 0], "y": transformed_data[:, 1]})
+        a = pd.DataFrame({"x": xy[0], "y": xy[1]})
         a.index.name = "point"
 
         # Select the nearest points from the projection coordinates.
@@ -751,11 +890,8 @@ class HerbieAccessor:
             print("GRIB_typeOfLevel", ds[var].attrs.get("GRIB_typeOfLevel"))
             print()
 
-            ds[var].attrs["units"] = (
-                ds[var]
-                .attrs["units"]
-                .replace("**-1", "$^{-1}$")
-                .replace("**-2", "$^{-2}$")
+            ds[var].attrs["units"] = _units_exponent.sub(
+                r"$^{\1}$", ds[var].attrs["units"]
             )
 
             defaults = dict(
@@ -7,28 +7,31 @@ TODO: There are probably use cases for the `Path().suffixes` method
 """
 
 import functools
+import glob
 import hashlib
 import itertools
 import json
 import logging
 import os
 import subprocess
-import urllib.request
+import threading
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from io import StringIO
+from io import BytesIO, StringIO
 from shutil import which
 from typing import Union, Optional, Literal
 
-import cfgrib
+import numpy as np
 import pandas as pd
-import pygrib
 import requests
 import xarray as xr
-from pyproj import CRS
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import herbie.models as model_templates
-from herbie import Path, config
+from herbie import Path, _probe_cache, _projection, config
 from herbie.help import _search_help
 from herbie.misc import ANSI
 
@@ -38,27 +41,168 @@ Datetime = Union[datetime, pd.Timestamp, str]
 # from the file ${HOME}/.config/herbie/config.toml
 # Path is imported from __init__ because it has my custom methods.
 
-try:
-    # Load custom xarray accessors
-    import herbie.accessors  # noqa: F401
-except Exception:
-    warnings.warn(
-        "herbie xarray accessors could not be imported."
-        "Probably missing a dependency like MetPy."
-        "If you want to use these functions, try"
-        "`pip install metpy`"
-    )
+
+@xr.register_dataset_accessor("herbie")
+class _HerbieAccessor:
+    """Register the ``ds.herbie`` accessor without importing it yet.
+
+    herbie.accessors (and pyproj) is slow to import and isn't needed to
+    find or download files, so it is imported the first time
+    ``ds.herbie`` is used.
+    """
+
+    def __new__(cls, xarray_obj):
+        from herbie.accessors import HerbieAccessor
+
+        return HerbieAccessor(xarray_obj)
+
 
 log = logging.getLogger(__name__)
 
 # Location of wgrib2 command, if it exists. Required to make missing idx files.
 wgrib2 = which("wgrib2")
 
-# Location of curl command. Required to download data.
-curl = which("curl")
-if curl is None:
-    warnings.warn(
-        "Curl is not in system Path. Herbie won't be able to download GRIB files."
+
+# A shared requests session lets the HEAD requests that look for GRIB2
+# and index files reuse connections instead of making a new connection
+# for every request. The pool is large enough for all the requests
+# Herbie makes at once when checking every source. Requests the server
+# was too busy for are tried again, but a server that can't be reached
+# isn't, so a source that is down doesn't slow down finding the file.
+_retry = Retry(
+    total=3,
+    connect=0,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    raise_on_status=False,
+)
+session = requests.Session()
+for _prefix in ["http://", "https://"]:
+    session.mount(
+        _prefix, HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=_retry)
+    )
+
+# find_grib and find_idx run at the same time and may both ping Pando.
+_pando_lock = threading.Lock()
+
+# Directories of cfgrib index files checked for index files of removed
+# GRIB2 files this session.
+_pruned_cfgrib_index_dirs = set()
+
+# Seconds to wait for a server to accept a connection and to respond to
+# a HEAD request, so an unresponsive source can't make Herbie hang.
+head_timeout = (10, 30)
+
+# Largest gap of unwanted bytes (messages not in the subset) between
+# two groups of messages that is downloaded to save a request.
+subset_max_gap = 256 * 1024
+
+# Seconds a parsed index file cached in ``save_dir/.idx_cache`` is used
+# when the index file wasn't requested, so it is unknown if it changed.
+index_cache_ttl = 24 * 60 * 60
+
+# The default product (first of the template's PRODUCTS) last used for
+# each model. It is given to the template when the user didn't specify
+# a product so the template usually only needs to run once.
+_default_products = {}
+
+
+def _file_version(headers) -> Optional[str]:
+    """Identify the version of a remote file from its response headers."""
+    version = [headers.get(k) for k in ("ETag", "Last-Modified", "Content-Length")]
+    return "|".join(i for i in version if i) or None
+
+
+def _remote_size(url: str, need_size: bool = True) -> Optional[int]:
+    """Size of a remote file in bytes, or None if it doesn't exist.
+
+    Some servers don't allow HEAD requests or don't give the file's
+    Content-Length. For those, request only the first byte; the file
+    size is the total in the Content-Range header. If ``need_size`` is
+    False, the size is 0 when a HEAD request finds the file but doesn't
+    give its size.
+    """
+    head = session.head(url, timeout=head_timeout)
+    if head.ok and (not need_size or "Content-Length" in head.headers):
+        return int(head.headers.get("Content-Length", 0))
+    if not head.ok and head.status_code not in {405, 501}:
+        return None
+
+    with session.get(
+        url, headers={"Range": "bytes=0-0"}, stream=True, timeout=head_timeout
+    ) as r:
+        if r.status_code == 206:
+            total = r.headers.get("Content-Range", "").rpartition("/")[2]
+            return int(total) if total.isdigit() else 0
+        elif r.ok:
+            return int(r.headers.get("Content-Length", 0))
+    return None
+
+
+def _first_found(check, items: list, max_workers: int = 4, discard=None):
+    """Check items in order and return the first one that is found.
+
+    ``check(item)`` returns a falsy value if the item isn't found. The
+    first item is usually found, so it is checked alone. If it isn't
+    found, the rest are checked at once (``max_workers`` at a time), and
+    checks that haven't started are cancelled when an earlier item is
+    found. ``discard`` is called with the results of later items that
+    were checked anyway.
+
+    Returns
+    -------
+    The first item found and the result of its check, or (None, None).
+    """
+    if not items:
+        return None, None
+    result = check(items[0])
+    if result:
+        return items[0], result
+
+    rest = items[1:]
+    found = (None, None)
+    with ThreadPoolExecutor(min(len(rest), max_workers) or 1) as exe:
+        futures = [exe.submit(check, i) for i in rest]
+        for item, future in zip(rest, futures):
+            if found[0] is not None:
+                if not future.cancel() and discard is not None:
+                    discard(future.result())
+                continue
+            result = future.result()
+            if result:
+                found = (item, result)
+    return found
+
+
+def _search_this(df: pd.DataFrame) -> pd.Series:
+    """Join the index file columns into a string Herbie can search.
+
+    The rows are joined as plain lists of strings, which is faster than
+    both ``DataFrame.apply`` and chaining pandas string operations for
+    index files with many messages.
+    """
+    rows = df.astype(str).fillna("nan").to_numpy().tolist()
+    return pd.Series(
+        [":" + ":".join(row).rstrip(":").replace(":nan:", ":") for row in rows],
+        index=df.index,
+    )
+
+
+def _model_names() -> set[str]:
+    """Names of the model templates."""
+    return {m for m in dir(model_templates) if not m.startswith("__")}
+
+
+def _byte_range(start: pd.Series, end: pd.Series) -> pd.Series:
+    """Make the ``"start-end"`` byte range strings for the index file.
+
+    The end byte of the last message in a wgrib2-style index file is
+    not known, so its range is left open (i.e., ``"12345-"``).
+    """
+    ends = end.fillna(-1).astype(int).tolist()
+    return pd.Series(
+        [f"{s}-{e}" if e >= 0 else f"{s}-" for s, e in zip(start.tolist(), ends)],
+        index=start.index,
     )
 
 
@@ -72,9 +216,10 @@ def wgrib2_idx(grib2filepath: Union[Path, str]) -> str:
         Path to a grib2 file.
     """
     if wgrib2:
+        # Run wgrib2 without a shell, which is faster and works with
+        # paths that have spaces.
         p = subprocess.run(
-            f"{wgrib2} -s {grib2filepath}",
-            shell=True,
+            [wgrib2, "-s", str(grib2filepath)],
             capture_output=True,
             encoding="utf-8",
             check=True,
@@ -191,13 +336,15 @@ class Herbie:
             self.fxx = pd.to_timedelta(fxx).round("1h").total_seconds() / 60 / 60
             self.fxx = int(self.fxx)
 
+        # pd.Timestamp parses a single date much faster than pd.to_datetime,
+        # which first tries to guess the format of an array of dates.
         if date:
             # User supplied `date`, which is the model initialization datetime.
-            self.date = pd.to_datetime(date)
+            self.date = pd.Timestamp(date)
             self.valid_date = self.date + timedelta(hours=self.fxx)
         elif valid_date:
             # User supplied `valid_date`, which is the model valid datetime.
-            self.valid_date = pd.to_datetime(valid_date)
+            self.valid_date = pd.Timestamp(valid_date)
             self.date = self.valid_date - timedelta(hours=self.fxx)
         else:
             raise ValueError("Must specify either `date` or `valid_date`")
@@ -232,15 +379,25 @@ class Herbie:
         # This line is equivalent to `model_templates.gfs.template(self)`.
         # I do it this way because the model name is a variable.
         # (see https://stackoverflow.com/a/7936588/2383070 for what I'm doing here)
-        getattr(model_templates, self.model).template(self)
+        template = getattr(model_templates, self.model).template
+        if product is None:
+            # The user didn't specify a product, so let's guess it is the
+            # same default product as the last time this model was used.
+            self.product = _default_products.get(self.model)
+        template(self)
 
         if product is None:
             # The user didn't specify a product, so let's use the first
             # product in the model template.
-            self.product = list(self.PRODUCTS)[0]
-            log.info(f'`product` not specified. Will use "{self.product}".')
-            # We need to rerun this so the sources have the new product value.
-            getattr(model_templates, self.model).template(self)
+            default_product = next(iter(self.PRODUCTS))
+            _default_products[self.model] = default_product
+            log.info(f'`product` not specified. Will use "{default_product}".')
+            if self.product != default_product:
+                # The guess was wrong (or this is the first time the model
+                # is used), so we need to rerun this so the sources have
+                # the new product value.
+                self.product = default_product
+                template(self)
 
         self.product_description = self.PRODUCTS[self.product]
 
@@ -255,6 +412,11 @@ class Herbie:
         # the index files are in a different style.
         self.IDX_STYLE = getattr(self, "IDX_STYLE", "wgrib2")
 
+        # Specify the minimum size (bytes) of a GRIB2 file for sources
+        # that might have empty files. For other sources, a GRIB2 file
+        # only needs to exist.
+        self.MIN_GRIB_SIZE = getattr(self, "MIN_GRIB_SIZE", {"nomads": 10})
+
         self.search_help = _search_help(self.IDX_STYLE)
 
         # Check the user input
@@ -263,8 +425,14 @@ class Herbie:
         # Ok, now we are ready to look for the GRIB2 file at each of the remote sources.
         # self.grib is the first existing GRIB2 file discovered.
         # self.idx is the first existing index file discovered.
-        self.grib, self.grib_source = self.find_grib()
-        self.idx, self.idx_source = self.find_idx()
+        # They don't depend on each other, so look for both at once. Each
+        # one usually makes a single request (to the first source in
+        # priority order), and a source that can't be reached is skipped.
+        with ThreadPoolExecutor(2) as exe:
+            find_grib = exe.submit(self.find_grib)
+            find_idx = exe.submit(self.find_idx)
+            self.grib, self.grib_source = find_grib.result()
+            self.idx, self.idx_source = find_idx.result()
 
         if verbose:
             # ANSI colors added for style points
@@ -324,8 +492,18 @@ class Herbie:
 
     def tell_me_everything(self) -> None:
         """Print all the attributes of the Herbie object."""
+        # Skip cached properties that haven't been computed yet because
+        # getattr would compute them (e.g., index_as_dataframe downloads
+        # the index file).
+        not_cached = {
+            k
+            for k, v in vars(type(self)).items()
+            if isinstance(v, functools.cached_property) and k not in self.__dict__
+        }
         msg = []
         for i in dir(self):
+            if i in not_cached:
+                continue
             if isinstance(getattr(self, i), (int, str, dict)):
                 if not i.startswith("__"):
                     msg.append(f"self.{i}={getattr(self, i)}")
@@ -342,14 +520,16 @@ class Herbie:
         if self.model.lower() == "alaska":
             self.model = "hrrrak"
 
-        _models = {m for m in dir(model_templates) if not m.startswith("__")}
-        _products = set(self.PRODUCTS)
-
         assert self.date < pd.Timestamp.utcnow().tz_localize(None), (
             "🔮 `date` cannot be in the future."
         )
-        assert self.model in _models, f"`model` must be one of {_models}"
-        assert self.product in _products, f"`product` must be one of {_products}"
+        # The messages (and the list of models) are only made if a check fails.
+        assert hasattr(model_templates, self.model), (
+            f"`model` must be one of {_model_names()}"
+        )
+        assert self.product in self.PRODUCTS, (
+            f"`product` must be one of {set(self.PRODUCTS)}"
+        )
 
         if isinstance(self.IDX_SUFFIX, str):
             self.IDX_SUFFIX = [self.IDX_SUFFIX]
@@ -358,7 +538,8 @@ class Herbie:
             self.priority = [self.priority]
 
         if self.priority is not None:
-            self.priority = [i.lower() for i in self.priority]
+            # Remove duplicates, but keep the order.
+            self.priority = list(dict.fromkeys(i.lower() for i in self.priority))
 
             # Don't look for data from NOMADS if requested date is earlier
             # than 14 days ago. NOMADS doesn't keep data that old,
@@ -370,15 +551,84 @@ class Herbie:
                 if self.date < expired:
                     self.priority.remove("nomads")
 
+            # We want to search SOURCES in the priority order. If priority
+            # is None, then search all SOURCES in the order given by the
+            # model template file.
+            # NOTE: A source from the template will not be used if it is
+            # not included in the priority list.
+            self.SOURCES = {
+                key: self.SOURCES[key] for key in self.priority if key in self.SOURCES
+            }
+
+    @classmethod
+    def clear_probe_cache(cls) -> None:
+        """Forget which remote GRIB2 and index files were found to exist.
+
+        Herbie remembers the result of looking for files on the remote
+        sources in ``save_dir/.herbie_probe_cache.sqlite``. Clear it if
+        a file was removed from a source.
+        """
+        _probe_cache.clear()
+
     def _ping_pando(self) -> None:
-        """Pinging the Pando server before downloading can prevent a bad handshake."""
+        """Pinging the Pando server before downloading can prevent a bad handshake.
+
+        Pando is only pinged once for each Herbie object.
+        """
+        with _pando_lock:
+            if getattr(self, "_pinged_pando", False):
+                return
+            self._pinged_pando = True
         try:
-            requests.head("https://pando-rgw01.chpc.utah.edu/")
+            session.head("https://pando-rgw01.chpc.utah.edu/", timeout=head_timeout)
         except Exception:
             print("🤝🏻⛔ Bad handshake with pando? Am I able to move on?")
             pass
 
-    def _check_grib(self, url: str, min_content_length: int = 10) -> bool:
+    def _cached_probe(self, url: str) -> Optional[bool]:
+        """Return if the URL exists from the probe cache, or None to check it.
+
+        The cache isn't used when overwrite is True. A model run from the
+        last day may still be uploading, so a file that didn't exist is
+        checked again sooner.
+        """
+        if self.overwrite:
+            return None
+        recent = self.date > pd.Timestamp.now("UTC").tz_localize(None) - pd.Timedelta(
+            days=1
+        )
+        return _probe_cache.get(url, recent=recent)
+
+    def _raise_for_status(self, response: requests.Response) -> None:
+        """Raise an error if downloading the GRIB2 file failed.
+
+        The file may have been removed from the source since it was
+        found, so the GRIB2 and index files are forgotten by the probe
+        cache and looked for again next time.
+        """
+        if not response.ok:
+            _probe_cache.forget(str(self.grib))
+            if isinstance(self.idx, str):
+                _probe_cache.forget(self.idx)
+        response.raise_for_status()
+
+    def _url_exists(self, url: str) -> bool:
+        """Check if a remote file exists, using the cached result if possible.
+
+        A source that can't be reached is treated as not having the file,
+        but that isn't cached.
+        """
+        exists = self._cached_probe(url)
+        if exists is None:
+            try:
+                exists = _remote_size(url, need_size=False) is not None
+            except requests.RequestException as e:
+                log.debug(f"Could not check {url}: {e}")
+                return False
+            _probe_cache.put(url, exists)
+        return exists
+
+    def _check_grib(self, url: str, min_content_length: Optional[int] = 10) -> bool:
         """
         Check that the GRIB2 URL exist and is of useful length.
 
@@ -386,42 +636,55 @@ class Herbie:
         ----------
         url : str
             Full URL path to the GRIB file
-        min_content_length : int
+        min_content_length : int or None
             The HTTP header content-length in bytes.
             Used to check a file is of useful size. This was once set to
             1_000_000 (1 MB), but there was an issue with NOMADS not
             providing this right (see #114). I decreased to 10 and
             essentially turned off this check.
+            If None, only check that the file exists.
+
+        A source that can't be reached is treated as not having the file,
+        but that isn't cached.
         """
-        head = requests.head(url)
-        check_exists = head.ok
-        if check_exists and "Content-Length" in head.raw.info():
-            check_content = int(head.raw.info()["Content-Length"]) > min_content_length
-            return check_exists and check_content
-        else:
+        exists = self._cached_probe(url)
+        if exists is not None:
+            return exists
+
+        try:
+            size = _remote_size(url, need_size=min_content_length is not None)
+        except requests.RequestException as e:
+            log.debug(f"Could not check {url}: {e}")
             return False
+        exists = size is not None and size > (min_content_length or -1)
+        if size:
+            # Remember the size so the last message in the index file
+            # can be given an end byte.
+            self.__dict__.setdefault("_grib_sizes", {})[url] = size
 
-    def _check_idx(self, url: str, verbose: bool = False) -> tuple[bool, Optional[str]]:
-        """Check if an index file exist for the GRIB2 URL."""
+        _probe_cache.put(url, exists)
+        return exists
+
+    def _idx_urls(self, url: str) -> list[str]:
+        """Possible index file URLs for the GRIB2 URL, one for each IDX_SUFFIX."""
         # To check inventory files with slightly different URL structure
-        # we will loop through the IDX_SUFFIX.
+        # we will make a URL for each of the IDX_SUFFIX.
+        if Path(url).suffix in {".grb", ".grib", ".grb2", ".grib2"}:
+            url = url.rsplit(".", maxsplit=1)[0]
+        return [url + i for i in self.IDX_SUFFIX]
 
+    def _check_idx(self, url: str, verbose: bool = False) -> tuple[bool, Optional[str]]:
+        """Check if an index file exist for the GRIB2 URL."""
         if verbose:
             print(f"🐜 {self.IDX_SUFFIX=}")
 
-        # Loop through IDX_SUFFIX options until we find one that exists
-        for i in self.IDX_SUFFIX:
-            if Path(url).suffix in {".grb", ".grib", ".grb2", ".grib2"}:
-                idx_url = url.rsplit(".", maxsplit=1)[0] + i
-            else:
-                idx_url = url + i
-
-            idx_exists = requests.head(idx_url).ok
-            if verbose:
-                print(f"🐜 {idx_url=}")
-                print(f"🐜 {idx_exists=}")
-            if idx_exists:
-                return idx_exists, idx_url
+        # Use the first IDX_SUFFIX option that exists.
+        idx_url, idx_exists = _first_found(self._url_exists, self._idx_urls(url))
+        if verbose:
+            print(f"🐜 {idx_url=}")
+            print(f"🐜 {idx_exists=}")
+        if idx_exists:
+            return idx_exists, idx_url
 
         if verbose:
             print(
@@ -440,78 +703,105 @@ class Herbie:
         """
         # But first, check if the GRIB2 file exists locally.
         local_grib = self.get_localFilePath()
-        if local_grib.exists() and not self.overwrite:
+        if not self.overwrite and os.path.isfile(local_grib):
             return local_grib, "local"
             # NOTE: We will still get the idx files from a remote
             #       because they aren't stored locally, or are they?   # TODO: If the idx file is local, then use that
 
-        # If priority list is set, we want to search SOURCES in that
-        # priority order. If priority is None, then search all SOURCES
-        # in the order given by the model template file.
-        # NOTE: A source from the template will not be used if it is not
-        # included in the priority list.
-        if self.priority is not None:
-            self.SOURCES = {
-                key: self.SOURCES[key] for key in self.priority if key in self.SOURCES
-            }
-
         # Ok, NOW we are ready to search for the remote GRIB2 files...
-        for source in self.SOURCES:
-            if "pando" in source:
-                # Sometimes pando returns a bad handshake. Pinging
-                # pando first can help prevent that.
-                self._ping_pando()
-
-            # Get the file URL for the source and determine if the
-            # GRIB2 file and the index file exist. If found, store the
-            # URL for the GRIB2 file and the .idx file.
-            grib_url = self.SOURCES[source]
-
+        # Remote sources are only checked if they come before the first
+        # local source that exists.
+        found = (None, None)
+        remote = {}
+        for source, grib_url in self.SOURCES.items():
             if source.startswith("local"):
                 grib_path = Path(grib_url)
-                if grib_path.exists():
-                    return (grib_path, source)
-            elif self._check_grib(grib_url):
-                return (grib_url, source)
-
-        return (None, None)
-
-    def find_idx(self) -> tuple[Optional[Union[Path, str]], Optional[str]]:
-        """Find an index file for the GRIB file."""
-        # If priority list is set, we want to search SOURCES in that
-        # priority order. If priority is None, then search all SOURCES
-        # in the order given by the model template file.
-        # NOTE: A source from the template will not be used if it is not
-        # included in the priority list.
-        if self.priority is not None:
-            self.SOURCES = {
-                key: self.SOURCES[key] for key in self.priority if key in self.SOURCES
-            }
+                if os.path.isfile(grib_path):
+                    found = (grib_path, source)
+                    break
+            else:
+                remote[source] = grib_url
 
-        # Ok, NOW we are ready to search for the remote GRIB2 files...
-        for source in self.SOURCES:
+        def check_grib(source):
             if "pando" in source:
                 # Sometimes pando returns a bad handshake. Pinging
                 # pando first can help prevent that.
                 self._ping_pando()
+            return self._check_grib(remote[source], self.MIN_GRIB_SIZE.get(source))
 
-            # Get the file URL for the source and determine if the
-            # GRIB2 file and the index file exist. If found, store the
-            # URL for the GRIB2 file and the .idx file.
-            grib_url = self.SOURCES[source]
+        # Return the first remote source in priority order that exists.
+        # The other sources are only checked if the first one doesn't.
+        source, _ = _first_found(check_grib, list(remote))
+        if source is not None:
+            return (remote[source], source)
+
+        return found
 
+    def find_idx(self) -> tuple[Optional[Union[Path, str]], Optional[str]]:
+        """Find an index file for the GRIB file."""
+        # Ok, NOW we are ready to search for the remote index files...
+        # Remote sources are only checked if they come before the first
+        # local source with an index file that exists.
+        found = (None, None)
+        remote = []
+        for source, grib_url in self.SOURCES.items():
             if source.startswith("local"):
                 local_grib = Path(grib_url)
                 local_idx = local_grib.with_suffix(self.IDX_SUFFIX[0])
-                if local_idx.exists():
-                    return (local_idx, "local")
+                if os.path.isfile(local_idx):
+                    found = (local_idx, "local")
+                    break
             else:
-                idx_exists, idx_url = self._check_idx(grib_url)
+                remote += [(source, i) for i in self._idx_urls(grib_url)]
 
-                if idx_exists:
-                    return (idx_url, source)
+        def get_idx(item):
+            """Request the index file, unless we already know if it exists.
 
-        return (None, None)
+            The response body isn't downloaded until it is read, so
+            only the index file that is used is downloaded.
+            """
+            source, idx_url = item
+            exists = self._cached_probe(idx_url)
+            if exists is not None:
+                return exists
+            if "pando" in source:
+                # Sometimes pando returns a bad handshake. Pinging
+                # pando first can help prevent that.
+                self._ping_pando()
+            try:
+                r = session.get(idx_url, stream=True, timeout=head_timeout)
+            except requests.RequestException as e:
+                # A source that can't be reached doesn't have the file,
+                # but don't remember that.
+                log.debug(f"Could not check {idx_url}: {e}")
+                return False
+            _probe_cache.put(idx_url, r.ok)
+            if not r.ok:
+                r.close()
+                return False
+            return r
+
+        def close(r):
+            if not isinstance(r, bool):
+                r.close()
+
+        # Return the first source and IDX_SUFFIX in priority order that
+        # exists; the others are only requested if it doesn't. Its content
+        # is kept for index_as_dataframe so it doesn't need to be requested
+        # again, unless it was already parsed and cached.
+        item, r = _first_found(get_idx, remote, discard=close)
+        if item is not None:
+            source, idx_url = item
+            if r is not True:
+                version = _file_version(r.headers)
+                self._idx_version = (idx_url, version)
+                cache_file = self._index_cache_file(idx_url, version)
+                if self.overwrite or not cache_file.exists():
+                    self._idx_content = (idx_url, r.content)
+                r.close()
+            return (idx_url, source)
+
+        return found
 
     @property
     def get_remoteFileName(self, source: Optional[str] = None) -> str:
@@ -523,7 +813,7 @@ class Herbie:
                 # Just pick the first source in the template
                 # Note: this might not always be the best approach
                 # the file names are not consistent between sources.
-                source = list(self.SOURCES)[0]
+                source = next(iter(self.SOURCES))
         return self.SOURCES[source].split("/")[-1]
 
     @property
@@ -551,13 +841,12 @@ class Herbie:
 
         # Check if any sources in a model template are "local"
         # (i.e., a custom template file)
-        if any([i.startswith("local") for i in self.SOURCES.keys()]):
+        local_paths = [
+            Path(url) for i, url in self.SOURCES.items() if i.startswith("local")
+        ]
+        if local_paths:
             localFilePath = next(
-                (
-                    Path(self.SOURCES[i])
-                    for i in self.SOURCES
-                    if i.startswith("local") and Path(self.SOURCES[i]).exists()
-                ),
+                (i for i in local_paths if os.path.isfile(i)),
                 localFilePath,
             )
 
@@ -602,9 +891,160 @@ class Herbie:
 
         return localFilePath
 
+    def _read_remote_idx(self) -> bytes:
+        """Content of the remote index file.
+
+        Use the content find_idx kept, if it is for this index file.
+        """
+        idx_url, content = self.__dict__.pop("_idx_content", (None, None))
+        if idx_url == self.idx:
+            return content
+
+        with session.get(self.idx, timeout=head_timeout) as response:
+            self._idx_version = (self.idx, _file_version(response.headers))
+            if response.status_code != 200:
+                response.raise_for_status()
+                raise ValueError(
+                    f"\nCant open index file {self.idx}\n"
+                    f"Download the full file first (with `H.download()`).\n"
+                    f"You will need to remake the Herbie object (H = `Herbie()`)\n"
+                    f"or delete this cached property: `del H.index_as_dataframe()`"
+                )
+            return response.content
+
+    def _index_cache_file(self, idx_url: str, version: Optional[str] = None) -> Path:
+        """File the parsed remote index file is cached in.
+
+        The file name includes a hash of the index file's version (from
+        its ETag, Last-Modified, and Content-Length headers) so a changed
+        index file isn't read from an old copy.
+        """
+        key = hashlib.blake2b(idx_url.encode(), digest_size=16).hexdigest()
+        if version is not None:
+            key += "." + hashlib.blake2b(version.encode(), digest_size=8).hexdigest()
+        return self.save_dir / ".idx_cache" / f"{key}.pkl"
+
+    def _index_cache_files(self, idx_url: str) -> list[Path]:
+        """All cached copies of the parsed remote index file."""
+        cache_file = self._index_cache_file(idx_url)
+        return list(cache_file.parent.glob(f"{cache_file.stem}*.pkl"))
+
+    def _cfgrib_indexpath(self, local_file: Path) -> str:
+        """Path template for cfgrib's index of a local GRIB2 file.
+
+        The index files are kept in ``save_dir/.cfgrib_idx`` at the same
+        relative path as the GRIB2 file. Index files older than their
+        GRIB2 file are removed because cfgrib won't replace them, and the
+        first time in a session, index files whose GRIB2 file was removed
+        are deleted. Returns an empty string (no index file) if the GRIB2
+        file isn't in the save_dir or the directory isn't writable.
+        """
+        save_dir = self.save_dir.resolve()
+        index_dir = save_dir / ".cfgrib_idx"
+        try:
+            index_file = index_dir / local_file.resolve().relative_to(save_dir)
+        except ValueError:
+            return ""
+        try:
+            index_file.parent.mkdir(parents=True, exist_ok=True)
+            prune = index_dir not in _pruned_cfgrib_index_dirs
+            _pruned_cfgrib_index_dirs.add(index_dir)
+            if prune:
+                old_indexes = index_dir.rglob("*.idx")
+            else:
+                old_indexes = index_file.parent.glob(
+                    f"{glob.escape(index_file.name)}.*.idx"
+                )
+            for old_index in old_indexes:
+                # Index files are named "<GRIB2 file name>.<short_hash>.idx".
+                grib_file = save_dir / old_index.relative_to(index_dir).with_name(
+                    old_index.name.rsplit(".", 2)[0]
+                )
+                if (
+                    not grib_file.exists()
+                    or old_index.stat().st_mtime < grib_file.stat().st_mtime
+                ):
+                    old_index.unlink(missing_ok=True)
+        except OSError:
+            return ""
+        # cfgrib fills in {short_hash}, so escape any braces in the path.
+        index_file = str(index_file).replace("{", "{{").replace("}", "}}")
+        return f"{index_file}.{{short_hash}}.idx"
+
     @functools.cached_property
     def index_as_dataframe(self) -> pd.DataFrame:
-        """Read and cache the full index file."""
+        """Read and cache the full index file.
+
+        The parsed remote index file is also cached in
+        ``save_dir/.idx_cache`` so other Herbie objects for the same
+        file don't need to download and parse it again. A cached copy is
+        used if it is for the same version of the index file. If the index
+        file wasn't requested (Herbie already knew it exists), the newest
+        copy is used if it is younger than ``index_cache_ttl`` seconds.
+        The cached copy is replaced when overwrite is True.
+        """
+        remote = (
+            self.grib_source != "local"
+            and self.idx_source not in ["local", "generated"]
+            and isinstance(self.idx, str)
+        )
+
+        df = None
+        if remote and not self.overwrite:
+            idx_url, version = self.__dict__.get("_idx_version", (None, None))
+            if idx_url == self.idx and version is not None:
+                cache_file = self._index_cache_file(self.idx, version)
+                fresh = cache_file.exists()
+            else:
+                cache_file = max(
+                    self._index_cache_files(self.idx),
+                    key=lambda f: f.stat().st_mtime,
+                    default=None,
+                )
+                fresh = (
+                    cache_file is not None
+                    and time.time() - cache_file.stat().st_mtime < index_cache_ttl
+                )
+            if fresh:
+                try:
+                    df = pd.read_pickle(cache_file)
+                except Exception:
+                    log.debug(f"Could not read cached index file {cache_file}")
+
+        if df is None:
+            df = self._parse_index_file()
+            if remote:
+                self._write_index_cache(df)
+
+        # Attach some attributes
+        df.attrs = dict(
+            url=self.idx,
+            source=self.idx_source,
+            description="Inventory index file for the GRIB2 file.",
+            model=self.model,
+            product=self.product,
+            lead_time=self.fxx,
+            datetime=self.date,
+        )
+
+        return df
+
+    def _write_index_cache(self, df: pd.DataFrame) -> None:
+        """Cache the parsed remote index file and remove older copies."""
+        idx_url, version = self.__dict__.get("_idx_version", (None, None))
+        if idx_url != self.idx:
+            version = None
+        cache_file = self._index_cache_file(self.idx, version)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            for old_file in self._index_cache_files(self.idx):
+                old_file.unlink()
+            df.to_pickle(cache_file)
+        except OSError:
+            log.debug(f"Could not cache index file to {cache_file}")
+
+    def _parse_index_file(self) -> pd.DataFrame:
+        """Read the full index file into a DataFrame."""
         if self.grib_source == "local" and wgrib2:
             # Generate IDX inventory with wgrib2
             self.idx = StringIO(wgrib2_idx(self.get_localFilePath()))
@@ -635,19 +1075,8 @@ class Herbie:
             if self.idx_source in ["local", "generated"]:
                 read_this_idx = self.idx
             else:
-                read_this_idx = None
-                response = requests.get(self.idx)
-                if response.status_code != 200:
-                    response.raise_for_status()
-                    response.close()
-                    raise ValueError(
-                        f"\nCant open index file {self.idx}\n"
-                        f"Download the full file first (with `H.download()`).\n"
-                        f"You will need to remake the Herbie object (H = `Herbie()`)\n"
-                        f"or delete this cached property: `del H.index_as_dataframe()`"
-                    )
-                read_this_idx = StringIO(response.text)
-                response.close()
+                # Let pandas decode the bytes instead of making a str copy.
+                read_this_idx = BytesIO(self._read_remote_idx())
 
             df = pd.read_csv(
                 read_this_idx,
@@ -666,16 +1095,24 @@ class Herbie:
             )
 
             # Format the DataFrame
+            # Every row usually has the same reference time, so parse each
+            # unique value once. The "d=" prefix is part of the format,
+            # which is faster than removing it first.
             df["reference_time"] = pd.to_datetime(
-                df.reference_time, format="d=%Y%m%d%H"
+                df.reference_time, format="d=%Y%m%d%H", cache=True
             )
-            df["valid_time"] = df["reference_time"] + pd.to_timedelta(f"{self.fxx}h")
+            df["valid_time"] = df["reference_time"] + pd.Timedelta(hours=self.fxx)
             df["start_byte"] = df["start_byte"].astype(int)
             df["end_byte"] = df["start_byte"].shift(-1) - 1
-            df["range"] = df.apply(
-                lambda x: f"{x.start_byte:.0f}-{x.end_byte:.0f}".replace("nan", ""),
-                axis=1,
-            )
+            # The last message ends at the end of the file, if we know
+            # its size; otherwise its range is left open-ended.
+            if isinstance(self.grib, Path):
+                grib_size = self.grib.stat().st_size if self.grib.is_file() else None
+            else:
+                grib_size = self.__dict__.get("_grib_sizes", {}).get(self.grib)
+            if grib_size and len(df):
+                df.loc[df.index[-1], "end_byte"] = grib_size - 1
+            df["range"] = _byte_range(df.start_byte, df.end_byte)
             df = df.reindex(
                 columns=[
                     "grib_message",
@@ -695,22 +1132,17 @@ class Herbie:
 
             df = df.dropna(how="all", axis=1)
 
-            df["search_this"] = (
-                df.loc[:, "variable":]
-                .astype(str)
-                .apply(
-                    lambda x: ":" + ":".join(x).rstrip(":").replace(":nan:", ":"),
-                    axis=1,
-                )
-            )
+            df["search_this"] = _search_this(df.loc[:, "variable":])
 
         if self.IDX_STYLE == "eccodes":
             # eccodes keywords explained here:
             # https://confluence.ecmwf.int/display/UDOC/Identification+keywords
 
-            r = requests.get(self.idx)
-            idxs = [json.loads(x) for x in r.text.split("\n") if x]
-            r.close()
+            content = self._read_remote_idx()
+            # Each line is a JSON object. Parsing them as one JSON array is
+            # about twice as fast as parsing each line separately.
+            lines = (x for x in content.splitlines() if x.strip())
+            idxs = json.loads(b"[" + b",".join(lines) + b"]")
             df = pd.DataFrame(idxs)
 
             # Format the DataFrame
@@ -719,9 +1151,11 @@ class Herbie:
             df = df.reset_index()
             df["start_byte"] = df["_offset"]
             df["end_byte"] = df["_offset"] + df["_length"]
-            df["range"] = df.start_byte.astype(str) + "-" + df.end_byte.astype(str)
+            df["range"] = _byte_range(df.start_byte, df.end_byte)
+            # Every row usually has the same reference time, so parse each
+            # unique value once.
             df["reference_time"] = pd.to_datetime(
-                df.date + df.time, format="%Y%m%d%H%M"
+                df.date + df.time, format="%Y%m%d%H%M", cache=True
             )
             df["step"] = pd.to_timedelta(df.step.astype(int), unit="h")
             df["valid_time"] = df.reference_time + df.step
@@ -748,31 +1182,13 @@ class Herbie:
                 ]
             )
 
-            df["search_this"] = (
-                df.loc[:, "param":]
-                .astype(str)
-                .apply(
-                    lambda x: ":" + ":".join(x).rstrip(":").replace(":nan:", ":"),
-                    axis=1,
-                )
-            )
-
-        # Attach some attributes
-        df.attrs = dict(
-            url=self.idx,
-            source=self.idx_source,
-            description="Inventory index file for the GRIB2 file.",
-            model=self.model,
-            product=self.product,
-            lead_time=self.fxx,
-            datetime=self.date,
-        )
+            df["search_this"] = _search_this(df.loc[:, "param":])
 
         return df
 
     def inventory(
         self,
-        search: Optional[str] = None,
+        search: Optional[Union[str, list[str]]] = None,
         *,
         searchString=None,
         verbose: Optional[bool] = None,
@@ -784,12 +1200,13 @@ class Herbie:
 
         Parameters
         ----------
-        search : str
+        search : str or list of str
             Filter dataframe by a search regular expression.
             Searches for strings in the index file lines, specifically
             the variable, level, and forecast_time columns.
             Execute ``_search_help()`` for examples of a good
-            search.
+            search. A list of regular expressions returns the messages
+            that match any of them.
 
             Read more in the user guide at
             https://herbie.readthedocs.io/en/latest/user_guide/tutorial/search.html
@@ -818,9 +1235,13 @@ class Herbie:
         if verbose is not None:
             self.verbose = verbose
 
+        # Match a list of searches in one pass.
+        if isinstance(search, (list, tuple)):
+            search = "|".join(f"(?:{i})" for i in search)
+
         # Filter DataFrame by regex search
         if search not in [None, ":"]:
-            logic = df.search_this.str.contains(search)
+            logic = self._search_mask(df, search)
             if (logic.sum() == 0) and verbose:
                 print(
                     f"No GRIB messages found. There might be something wrong with {search=}"
@@ -829,6 +1250,19 @@ class Herbie:
             df = df.loc[logic]
         return df
 
+    def _search_mask(self, df: pd.DataFrame, search: str) -> np.ndarray:
+        """Rows of the index DataFrame that match the search regex.
+
+        The result is kept for each search because the same search is
+        repeated when a subset is downloaded and opened with xarray.
+        """
+        if getattr(self, "_search_masks", (None,))[0] is not df:
+            self._search_masks = (df, {})
+        masks = self._search_masks[1]
+        if search not in masks:
+            masks[search] = df.search_this.str.contains(search).to_numpy()
+        return masks[search]
+
     def download(
         self,
         search: Optional[str] = None,
@@ -876,18 +1310,17 @@ class Herbie:
 
         """
 
-        def _reporthook(a, b, c):
+        def _reporthook(size, total_size):
             """
             Print download progress in megabytes.
 
             Parameters
             ----------
-            a : Chunk number
-            b : Maximum chunk size
-            c : Total size of the download
+            size : Bytes of the file downloaded so far
+            total_size : Total size of the file
             """
-            chunk_progress = a * b / c * 100
-            total_size_MB = c / 1000000.0
+            chunk_progress = size / total_size * 100
+            total_size_MB = total_size / 1000000.0
             if verbose:
                 print(
                     f"\r🚛💨  Download Progress: {chunk_progress:.2f}% of {total_size_MB:.1f} MB\r",
@@ -896,69 +1329,143 @@ class Herbie:
 
         def subset(search, outFile):
             """Download a subset specified by the regex search."""
-            # TODO: Maybe optimize downloading multiple subsets with MultiThreading
-
-            # TODO An alternative to downloadling subset with curl is
-            # TODO  to use the request module directly.
-            # TODO  >> headers = dict(Range=f"bytes={start_bytes}-{end_bytes}")
-            # TODO  >> r = requests.get(grib_url, headers=headers)
-
             grib_source = self.grib
-            if hasattr(grib_source, "as_posix") and grib_source.exists():
-                # The GRIB source is local. Curl the local file
-                # See https://stackoverflow.com/a/21023161/2383070
-                grib_source = f"file://{str(self.grib)}"
+            local_source = hasattr(grib_source, "as_posix") and grib_source.exists()
             if verbose:
                 print(
-                    f"📇 Download subset: {self.__repr__()}{' ':60s}\n cURL from {grib_source}"
+                    f"📇 Download subset: {self.__repr__()}{' ':60s}\n from {grib_source}"
                 )
 
             # -----------------------------------------------------
-            # Download subsets of the file by byte range with cURL.
-            #  Instead of using a single curl command for each row,
-            #  group adjacent messages in the same curl command.
+            # Download subsets of the file by byte range.
+            #  Instead of requesting each row, group adjacent messages
+            #  in the same range request.
 
             # Find index groupings
-            idx_df = self.inventory(search).copy()
+            idx_df = self.inventory(search)
             if verbose:
                 print(
                     f"Found {ANSI.bold}{ANSI.green}{len(idx_df)}{ANSI.reset} grib messages."
                 )
-            idx_df["download_groups"] = idx_df.grib_message.diff().ne(1).cumsum()
-
-            # cURL subsets of each group
-            for i, curl_group in idx_df.groupby("download_groups"):
+            # A new group starts where the message numbers aren't consecutive.
+            grib_messages = idx_df.grib_message.to_numpy()
+            search_strings = idx_df.search_this.to_numpy()
+            breaks = np.flatnonzero(np.diff(grib_messages) != 1) + 1
+            row_groups = np.split(np.arange(len(idx_df)), breaks) if len(idx_df) else []
+            start_bytes = idx_df.start_byte.to_numpy()
+            end_bytes = idx_df.end_byte.to_numpy(dtype=float)
+
+            # Byte range of each group.
+            groups = []
+            for i, rows in enumerate(row_groups, 1):
                 if verbose:
                     print(f"Download subset group {i}")
-
-                if verbose:
-                    for _, row in curl_group.iterrows():
-                        print(
-                            f"  {row.grib_message:<3g} {ANSI.orange}{row.search_this}{ANSI.reset}"
+                    print(
+                        "\n".join(
+                            f"  {message:<3g} {ANSI.orange}{search_this}{ANSI.reset}"
+                            for message, search_this in zip(
+                                grib_messages[rows], search_strings[rows]
+                            )
                         )
+                    )
 
-                range = f"{curl_group.start_byte.min():.0f}-{curl_group.end_byte.max():.0f}".replace(
-                    "nan", ""
-                )
+                # The last message in the file has no end byte; don't
+                # skip it when finding the end of the group (np.max
+                # returns NaN if there is a NaN).
+                start_byte = int(start_bytes[rows].min())
+                end_byte = end_bytes[rows].max()
+                range = f"{start_byte}-{end_byte:.0f}".replace("nan", "")
 
-                if curl_group.end_byte.max() - curl_group.start_byte.min() < 0:
+                if end_byte - start_byte < 0:
                     # The byte range for GRIB submessages (like in the
                     # RAP model's UGRD/VGRD) need to be handled differently.
                     # See https://github.com/blaylockbk/Herbie/issues/259
                     if verbose:
-                        print(f"  ERROR: Invalid cURL range {range}; Skip message.")
+                        print(f"  ERROR: Invalid range {range}; Skip message.")
                     continue
 
-                if i == 1:
-                    # If we are working on the first item, overwrite the existing file...
-                    curl = f'''curl -s --range {range} "{grib_source}" > "{outFile}"'''
-                else:
-                    # ...all other messages are appended to the subset file.
-                    curl = f'''curl -s --range {range} "{grib_source}" >> "{outFile}"'''
-
                 if verbose:
-                    print(curl)
-                os.system(curl)
+                    print(f"  range {range}")
+                groups.append((start_byte, end_byte))
+
+            # A request costs more than downloading a few unwanted
+            # messages, so groups close together are requested as one
+            # range and the bytes between them are skipped. Each range is
+            # [start_byte, end_byte, parts to keep, offset in subset file].
+            ranges = []
+            offset = 0
+            for start_byte, end_byte in groups:
+                gap = start_byte - ranges[-1][1] - 1 if ranges else -1
+                if not local_source and 0 <= gap <= subset_max_gap:
+                    ranges[-1][1] = end_byte
+                else:
+                    ranges.append([start_byte, end_byte, [], offset])
+                first_byte = ranges[-1][0]
+                if pd.isna(end_byte):
+                    ranges[-1][2].append((start_byte - first_byte, None))
+                else:
+                    ranges[-1][2].append(
+                        (start_byte - first_byte, int(end_byte) - first_byte + 1)
+                    )
+                    offset += int(end_byte) - start_byte + 1
+
+            def get_range(start_byte, end_byte, parts, offset):
+                """Write the parts of the range to their place in the subset file."""
+                range = f"{start_byte}-{end_byte:.0f}".replace("nan", "")
+                with open(partFile, "r+b") as f:
+                    f.seek(offset)
+                    if local_source:
+                        with open(grib_source, "rb") as grib:
+                            grib.seek(start_byte)
+                            size = (
+                                -1
+                                if pd.isna(end_byte)
+                                else int(end_byte) - start_byte + 1
+                            )
+                            f.write(grib.read(size))
+                        return
+
+                    with session.get(
+                        grib_source,
+                        headers={"Range": f"bytes={range}"},
+                        stream=True,
+                        timeout=head_timeout,
+                    ) as r:
+                        self._raise_for_status(r)
+                        if r.status_code != 206:
+                            raise ValueError(
+                                f"{grib_source} did not return the byte range {range}."
+                            )
+                        # Write the parts of each chunk that are kept.
+                        position = 0
+                        for chunk in r.iter_content(chunk_size=1024 * 1024):
+                            for a, b in parts:
+                                a = max(a - position, 0)
+                                b = len(chunk) if b is None else b - position
+                                if a < b:
+                                    f.write(chunk[a:b])
+                            position += len(chunk)
+
+            # Request all the byte ranges at once. Each range is written
+            # at its offset, so the messages are in order in the file.
+            # Make the file its final size first (except for the last
+            # message in the file, whose size isn't known) so writes
+            # don't need to grow it. The subset is written to a partial
+            # file that is renamed when all the ranges are written, so a
+            # failed request doesn't leave an incomplete subset file.
+            partFile = outFile.with_name(f"{outFile.name}.partial")
+            with open(partFile, "wb") as f:
+                f.truncate(offset)
+            try:
+                # Object stores like S3 start to slow down requests if too
+                # many are made at once.
+                if ranges:
+                    with ThreadPoolExecutor(min(len(ranges), 8)) as exe:
+                        list(exe.map(lambda r: get_range(*r), ranges))
+            except BaseException:
+                partFile.unlink(missing_ok=True)
+                raise
+            partFile.replace(outFile)
 
             if verbose:
                 print(f"💾 Saved the subset to {outFile}")
@@ -976,21 +1483,13 @@ class Herbie:
         if save_dir is not None:
             self.save_dir = Path(save_dir).expand()
 
-        if not hasattr(Path(self.save_dir).expand(), "exists"):
-            self.save_dir = Path(self.save_dir).expand()
-
         # If the file exists in the localPath and we don't want to
         # overwrite, then we don't need to download it.
         outFile = self.get_localFilePath(search)
 
         if save_dir is not None:
             # Looks like the save_dir was changed.
-            outFile = (
-                self.save_dir.expand()
-                / self.model
-                / f"{self.date:%Y%m%d}"
-                / outFile.name
-            )
+            outFile = self.save_dir / self.model / f"{self.date:%Y%m%d}" / outFile.name
 
         # This overrides the overwrite specified in __init__
         if overwrite is not None:
@@ -1041,8 +1540,65 @@ class Herbie:
         # Do the Download
         # ===============
         if search in [None, ":"] or self.idx is None:
-            # Download the full file from remote source
-            urllib.request.urlretrieve(self.grib, outFile, _reporthook)
+            # Download the full file from remote source in large chunks.
+            # The file is renamed when the download is done so an
+            # interrupted download isn't mistaken for a complete file,
+            # and the next download resumes where it stopped. The remote
+            # file's ETag or Last-Modified is kept with the partial file
+            # and sent as If-Range, so the server sends the whole file
+            # again if it changed since the partial file was started.
+            partFile = outFile.with_name(f"{outFile.name}.partial")
+            versionFile = outFile.with_name(f"{outFile.name}.partial.version")
+            if self.overwrite:
+                partFile.unlink(missing_ok=True)
+            have = (
+                partFile.stat().st_size
+                if partFile.exists() and versionFile.exists()
+                else 0
+            )
+            headers = (
+                {"Range": f"bytes={have}-", "If-Range": versionFile.read_text()}
+                if have
+                else {}
+            )
+            chunk_size = 4 * 1024 * 1024
+            with session.get(
+                self.grib, headers=headers, stream=True, timeout=head_timeout
+            ) as r:
+                # The partial file is already complete if there are no
+                # more bytes to download.
+                if not (have and r.status_code == 416):
+                    self._raise_for_status(r)
+                    if r.status_code != 206:
+                        # The server sent the whole file.
+                        have = 0
+                        etag = r.headers.get("ETag", "")
+                        version = (
+                            etag
+                            if etag and not etag.startswith("W/")
+                            else r.headers.get("Last-Modified")
+                        )
+                        if version:
+                            versionFile.write_text(version)
+                        else:
+                            versionFile.unlink(missing_ok=True)
+                    elif verbose:
+                        print(f"Resume download of {partFile} at {have} bytes")
+                    # When resuming, the Content-Length is only the rest of
+                    # the file; the size of the file is in the Content-Range.
+                    total_size = r.headers.get("Content-Range", "").rpartition("/")[2]
+                    if total_size.isdigit():
+                        total_size = int(total_size)
+                    else:
+                        total_size = have + int(r.headers.get("Content-Length", -1))
+                    size = have
+                    with open(partFile, "ab" if have else "wb") as f:
+                        for chunk in r.iter_content(chunk_size):
+                            f.write(chunk)
+                            size += len(chunk)
+                            _reporthook(size, total_size)
+            partFile.replace(outFile)
+            versionFile.unlink(missing_ok=True)
 
             original_source = self.grib
 
@@ -1076,6 +1632,10 @@ class Herbie:
         ----------
         search : str
             Variables to read into xarray Dataset
+        backend_kwargs : dict
+            Arguments passed to cfgrib. By default, cfgrib's index of the
+            file is kept in ``save_dir/.cfgrib_idx`` so the file opens
+            faster next time; set ``indexpath=""`` to not make one.
         remove_grib : bool
             If True, grib file will be removed ONLY IF it didn't exist
             before we downloaded it.
@@ -1090,6 +1650,8 @@ class Herbie:
             search = searchString
 
         download_kwargs = {**dict(overwrite=False), **download_kwargs}
+        # Copy so the defaults set below aren't kept between calls.
+        backend_kwargs = dict(backend_kwargs)
 
         local_file = self.get_localFilePath(search)
 
@@ -1097,10 +1659,7 @@ class Herbie:
             # Looks like the save_dir was changed.
             self.save_dir = Path(download_kwargs["save_dir"]).expand()
             local_file = (
-                self.save_dir.expand()
-                / self.model
-                / f"{self.date:%Y%m%d}"
-                / local_file.name
+                self.save_dir / self.model / f"{self.date:%Y%m%d}" / local_file.name
             )
 
         #!==============================================================
@@ -1124,71 +1683,90 @@ class Herbie:
         if not local_file.exists() or download_kwargs["overwrite"]:
             self.download(search=search, **download_kwargs)
 
+        # cfgrib (and eccodes) is slow to import, so only import it when
+        # it is needed to open a file.
+        import cfgrib
+
         # Backend kwargs for cfgrib
-        backend_kwargs.setdefault("indexpath", "")
-        backend_kwargs.setdefault(
+        # Keep cfgrib's index of the file so opening it again doesn't need
+        # to scan every message. Files that will be removed don't need one.
+        if "indexpath" not in backend_kwargs:
+            backend_kwargs["indexpath"] = (
+                "" if remove_grib else self._cfgrib_indexpath(local_file)
+            )
+        # The keys used to get the grid projection are always read.
+        read_keys = backend_kwargs.get(
             "read_keys",
             ["parameterName", "parameterUnits", "stepRange", "uvRelativeToGrid"],
         )
+        backend_kwargs["read_keys"] = list(
+            dict.fromkeys([*read_keys, *_projection.READ_KEYS])
+        )
         backend_kwargs.setdefault("errors", "raise")
 
-        # Use cfgrib.open_datasets, just in case there are multiple "hypercubes"
-        # for what we requested.
-        Hxr = cfgrib.open_datasets(
-            local_file,
-            backend_kwargs=backend_kwargs,
-        )
+        # A subset is usually one "hypercube", which cfgrib.open_dataset
+        # reads in one pass. cfgrib.open_datasets reads the file once for
+        # each variable, so only use it if there are multiple "hypercubes"
+        # for what we requested (which is likely for full files).
+        # The path is given as a str because cfgrib only reuses its index
+        # file if the path matches the one it was made with.
+        Hxr = None
+        if search is not None:
+            try:
+                Hxr = [
+                    cfgrib.open_dataset(str(local_file), backend_kwargs=backend_kwargs)
+                ]
+            except cfgrib.DatasetBuildError:
+                pass
+        if Hxr is None:
+            Hxr = cfgrib.open_datasets(
+                str(local_file),
+                backend_kwargs=backend_kwargs,
+            )
 
-        # Get CF grid projection information with pygrib and pyproj because
-        # this is something cfgrib doesn't do (https://github.com/ecmwf/cfgrib/issues/251)
+        # Get CF grid projection information with pyproj because this is
+        # something cfgrib doesn't do (https://github.com/ecmwf/cfgrib/issues/251).
+        # The projection is built from the GRIB keys cfgrib already read,
+        # so the file doesn't need to be opened again with pygrib.
         # NOTE: Assumes the projection is the same for all variables
-        # TODO: Issues with pygrib in tests. Segmentation Fault. Is it Numpy 2???
-        use_pygrib = False
-        if use_pygrib:
-            with pygrib.open(str(local_file)) as grb:
-               msg = grb.message(1)
-               cf_params = CRS(msg.projparams).to_cf()
-
-            #grb = pygrib.open(str(local_file))
-            #msg = grb.message(1)
-            #cf_params = CRS(msg.projparams).to_cf()
-            #grb.close()
-
-            # Funny stuff with polar stereographic (https://github.com/pyproj4/pyproj/issues/856)
-            # TODO: Is there a better way to handle this? What about south pole?
-            if cf_params["grid_mapping_name"] == "polar_stereographic":
-                cf_params["latitude_of_projection_origin"] = cf_params.get(
-                    "latitude_of_projection_origin", 90
-                )
+        projparams = _projection.projparams_from_grib_attrs(Hxr[0]) if Hxr else None
+        if projparams is not None:
+            cf_params = _projection.cf_params(projparams)
         else:
             cf_params = {}
 
+        # Note: all attributes should still work with the `ds.to_netcdf()` method.
+        attrs = dict(
+            model=str(self.model),
+            product=str(self.product),
+            description=self.DESCRIPTION,
+            remote_grib=str(self.grib),
+            local_grib=str(local_file),
+            search=str(search),
+        )
+        projection_attrs = {
+            **cf_params,
+            "long_name": f"{self.model.upper()} model grid projection",
+        }
+
         # Here I'm looping over each dataset in the list returned by cfgrib
         for ds in Hxr:
             # ----------------
             # Add some details
             # ----------------
-            # Note: all attributes should still work with the `ds.to_netcdf()` method.
-            ds.attrs["model"] = str(self.model)
-            ds.attrs["product"] = str(self.product)
-            ds.attrs["description"] = self.DESCRIPTION
-            ds.attrs["remote_grib"] = str(self.grib)
-            ds.attrs["local_grib"] = str(local_file)
-            ds.attrs["search"] = str(search)
+            ds.attrs.update(attrs)
 
             # ----------------------
             # Attach CF grid mapping
             # ----------------------
             # http://cfconventions.org/Data/cf-conventions/cf-conventions-1.8/cf-conventions.html#appendix-grid-mappings
             ds.coords["gribfile_projection"] = None
-            ds.coords["gribfile_projection"].attrs = cf_params
-            ds.coords["gribfile_projection"].attrs["long_name"] = (
-                f"{self.model.upper()} model grid projection"
-            )
+            ds.coords["gribfile_projection"].attrs = dict(projection_attrs)
 
-            # Assign this grid_mapping for all variables
-            for var in list(ds):
-                ds[var].attrs["grid_mapping"] = "gribfile_projection"
+            # Assign this grid_mapping for all variables. Change the
+            # attrs on the variables so no DataArrays are made.
+            for var in ds.data_vars:
+                ds.variables[var].attrs["grid_mapping"] = "gribfile_projection"
 
         if remove_grib:
             # Load the datasets into memory before removing the file
@@ -2,29 +2,45 @@
 A Herbie template for the HAFS model.
 """
 
-import requests
 import re
 import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+log = logging.getLogger(__name__)
 
 
 class Storms:
-    # TODO: This is a little slow 4-6 seconds); at least the caching seems to work.
     def __init__(self):
         pass
 
     @functools.cached_property
     def id_to_name(self):
+        # Use Herbie's requests session to reuse the connection to NOMADS.
+        from herbie.core import head_timeout, session
+
         URL = "https://nomads.ncep.noaa.gov/pub/data/nccf/com/hafs/prod/inphfsa/"
-        messages = set(
-            re.findall(
-                r"message\d+",
-                requests.get(URL).text,
-            )
-        )
+        response = session.get(URL, timeout=head_timeout)
+        response.raise_for_status()
+        messages = set(re.findall(r"message\d+", response.text))
+
+        def get_message(message):
+            """Text of a storm message, or None if it can't be read."""
+            try:
+                response = session.get(URL + message, timeout=head_timeout)
+            except requests.RequestException as e:
+                log.debug(f"Could not read {URL + message}: {e}")
+                return None
+            return response.text if response.ok else None
+
+        # Request all the messages at once.
+        with ThreadPoolExecutor(min(max(len(messages), 1), 10)) as exe:
+            texts = [text for text in exe.map(get_message, messages) if text]
 
         storms = {}
-        for message in messages:
-            text = requests.get(URL + message).text
+        for text in texts:
             center, storm_id, storm_name, _ = re.split(r"\s+", text, maxsplit=3)
             storms[storm_id.lower()] = storm_name.lower()
         return storms
@@ -61,6 +61,11 @@ IDX_STYLE : {'wgrib2', 'eccodes'}
     This defines how the index will be interpreted.
     - NCEP products use ``wgrib2`` to create index files.
     - ECMWF products use ``eccodes`` to create index files.
+
+MIN_GRIB_SIZE : dict
+    Default value is {"nomads": 10}. The minimum size (in bytes) of a
+    GRIB2 file for each source that might have empty or incomplete
+    files. GRIB2 files from other sources only need to exist.
 """
 __all__ = ["hrrr", "hrrrak"]
 
@@ -33,9 +33,9 @@ import subprocess
 
 
 def run_command(cmd):
+    """Run a command, given as a list of arguments, and return its output."""
     p = subprocess.run(
         cmd,
-        shell=True,
         capture_output=True,
         encoding="utf-8",
         check=True,
@@ -51,7 +51,7 @@ class _WGRIB2:
 
     def inventory(self, FILE):
         """Return wgrib2-style inventory of GRIB2 file."""
-        cmd = f"{self.wgrib2} -s {Path(FILE).expand()}"
+        cmd = [self.wgrib2, "-s", str(Path(FILE).expand())]
         return run_command(cmd)
 
     def create_inventory_file(self, path, suffix=".grib2"):
@@ -139,7 +139,16 @@ class _WGRIB2:
         for f in files:
             OUTFILE = path.parent / f"{name}_{path.name}"
 
-            cmd = f"{self.wgrib2} {Path(path).expand()} -small_grib {lon_min}:{lon_max} {lat_min}:{lat_max} {OUTFILE} -set_grib_type same"
+            cmd = [
+                self.wgrib2,
+                str(Path(path).expand()),
+                "-small_grib",
+                f"{lon_min}:{lon_max}",
+                f"{lat_min}:{lat_max}",
+                str(OUTFILE),
+                "-set_grib_type",
+                "same",
+            ]
 
             run_command(cmd)
 
@@ -170,7 +179,7 @@ class _WGRIB2:
         path : path-like
             Path to the grib2 file.
         """
-        cmd = f"{self.wgrib2} -vector_dir {Path(path).expand()}"
+        cmd = [self.wgrib2, "-vector_dir", str(Path(path).expand())]
 
         out = run_command(cmd)
         relative = {i.split(":")[-1] for i in out.split()}
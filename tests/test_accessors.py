@@ -40,3 +40,39 @@ def test_polygon():
 def test_with_wind():
     ds = Herbie("2024-01-01").xarray("GRD:10 m above").herbie.with_wind()
     assert len(ds) == 4
+
+
+def test_center():
+    """Test the center is the (longitude, latitude) midpoint of the grid."""
+    z = xr.Dataset(
+        coords={
+            "latitude": (["y", "x"], [[40, 40], [42, 42]]),
+            "longitude": (["y", "x"], [[-100, -98], [-100, -98]]),
+        }
+    )
+    assert z.herbie.center == (-99, 41)
+
+
+def test_pick_points_outside_regional_grid():
+    """Test points just outside a regional grid are matched to the nearest edge."""
+    import numpy as np
+    import pandas as pd
+
+    lon = np.arange(-130, -60.25, 0.5)
+    ds = xr.Dataset(
+        {"a": (["latitude", "longitude"], np.zeros((3, len(lon))))},
+        coords={"latitude": [39.5, 40, 40.5], "longitude": lon},
+    )
+    points = pd.DataFrame({"latitude": [40, 40], "longitude": [-130.2, -60.3]})
+    p = ds.herbie.pick_points(points, method="nearest", k=1)
+    assert list(p.longitude.values) == [-130, -60.5]
+    assert all(p.point_grid_distance < 20)
+
+    # A global grid wraps around.
+    ds = xr.Dataset(
+        {"a": (["latitude", "longitude"], np.zeros((3, 720)))},
+        coords={"latitude": [39.5, 40, 40.5], "longitude": np.arange(0, 360, 0.5)},
+    )
+    points = pd.DataFrame({"latitude": [40], "longitude": [-0.2]})
+    p = ds.herbie.pick_points(points, method="nearest", k=1)
+    assert p.longitude.item() == 0
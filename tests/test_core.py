@@ -1,12 +1,266 @@
 """Tests for Herbie's core functionality."""
 
-from herbie import Herbie
+import pandas as pd
+import pytest
 
+from herbie import Herbie, _probe_cache, config
 
-def test_Herbie_bool():
+
+@pytest.fixture(autouse=True)
+def probe_cache(tmp_path, monkeypatch):
+    """Keep the probe cache in a temporary directory for each test."""
+    monkeypatch.setitem(config["default"], "save_dir", tmp_path)
+    monkeypatch.setattr(_probe_cache, "_connection", None)
+    yield
+    if _probe_cache._connection:
+        _probe_cache._connection.close()
+
+
+def test_Herbie_bool(tmp_path):
     """Test that Herbie __bool__ dunder method."""
-    H = Herbie("2023-01-01", model="hrrr", priority=["aws"])
+    H = Herbie("2023-01-01", model="hrrr", priority=["aws"], save_dir=tmp_path)
     assert bool(H)
 
-    H = Herbie("2000-01-01", model="hrrr", priority=["aws"])
+    H = Herbie("2000-01-01", model="hrrr", priority=["aws"], save_dir=tmp_path)
     assert not bool(H)
+
+
+def test_probe_cache(tmp_path, monkeypatch):
+    """Test that HEAD request results are cached."""
+    url = "https://example.com/file.grib2"
+    assert _probe_cache.get(url) is None
+
+    _probe_cache.put(url, True)
+    assert _probe_cache.get(url) is True
+    assert _probe_cache.cache_file() == tmp_path / ".herbie_probe_cache.sqlite"
+    assert _probe_cache.cache_file().exists()
+
+    # Files that don't exist are checked again after the TTL.
+    _probe_cache.put(url, False)
+    assert _probe_cache.get(url) is False
+    monkeypatch.setattr(_probe_cache, "TTL_NOT_FOUND", -1)
+    assert _probe_cache.get(url) is None
+
+    # Recent files that don't exist are checked again sooner.
+    monkeypatch.setattr(_probe_cache, "TTL_NOT_FOUND", 3600)
+    monkeypatch.setattr(_probe_cache, "TTL_NOT_FOUND_RECENT", -1)
+    assert _probe_cache.get(url) is False
+    assert _probe_cache.get(url, recent=True) is None
+
+    # Files that exist are checked again after the TTL, or when forgotten.
+    _probe_cache.put(url, True)
+    monkeypatch.setattr(_probe_cache, "TTL_FOUND", -1)
+    assert _probe_cache.get(url) is None
+    monkeypatch.setattr(_probe_cache, "TTL_FOUND", 3600)
+    assert _probe_cache.get(url) is True
+    _probe_cache.forget(url)
+    assert _probe_cache.get(url) is None
+
+    _probe_cache.put(url, True)
+    Herbie.clear_probe_cache()
+    assert _probe_cache.get(url) is None
+
+
+def test_index_cache(tmp_path, monkeypatch):
+    """Test that a parsed remote index file is cached in the save_dir."""
+    import herbie.core
+
+    idx = (
+        b"1:0:d=2024010100:TMP:2 m above ground:anl:\n"
+        b"2:100:d=2024010100:UGRD:10 m above ground:anl:\n"
+    )
+
+    class Response:
+        ok = True
+        status_code = 200
+        content = idx
+        headers = {"Content-Length": "1000"}
+
+        def close(self):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+    requested = []
+
+    def get(url, **kwargs):
+        requested.append(url)
+        return Response()
+
+    monkeypatch.setattr(herbie.core.session, "head", lambda url, **kw: Response())
+    monkeypatch.setattr(herbie.core.session, "get", get)
+    monkeypatch.setattr(_probe_cache, "get", lambda url, **kw: True)
+
+    kwargs = dict(model="hrrr", priority=["aws"], save_dir=tmp_path)
+    H = Herbie("2024-01-01", **kwargs)
+    df = H.index_as_dataframe
+    assert requested == [H.idx]
+    assert H._index_cache_file(H.idx, "1000").exists()
+
+    H = Herbie("2024-01-01", **kwargs)
+    assert H.index_as_dataframe.equals(df)
+    assert len(requested) == 1
+
+    # The cached copy is replaced when overwrite is True. The GRIB2 file
+    # was checked this time, so the last message ends at its size.
+    H = Herbie("2024-01-01", **kwargs, overwrite=True)
+    assert len(requested) == 2
+    assert H.index_as_dataframe.end_byte.iloc[-1] == 999
+    assert H.index_as_dataframe.range.iloc[-1] == "100-999"
+    assert pd.isna(df.end_byte.iloc[-1])
+
+    # A cached copy isn't used if the index file changed...
+    monkeypatch.setattr(_probe_cache, "get", lambda url, **kw: None)
+    Response.content = idx + b"3:200:d=2024010100:VGRD:10 m above ground:anl:\n"
+    Response.headers = {"Content-Length": "2000"}
+    H = Herbie("2024-01-01", **kwargs)
+    assert len(H.index_as_dataframe) == 3
+    assert len(H._index_cache_files(H.idx)) == 1
+
+    # ...or if it wasn't requested and the cached copy is too old.
+    monkeypatch.setattr(_probe_cache, "get", lambda url, **kw: True)
+    monkeypatch.setattr(herbie.core, "index_cache_ttl", -1)
+    n = len(requested)
+    H = Herbie("2024-01-01", **kwargs)
+    assert len(H.index_as_dataframe) == 3
+    assert len(requested) == n + 1
+
+
+def test_unreachable_source(tmp_path, monkeypatch):
+    """Test that a source that can't be reached is skipped."""
+    import requests
+
+    import herbie.core
+
+    class Response:
+        ok = True
+        status_code = 200
+        content = b"1:0:d=2024010100:TMP:2 m above ground:anl:\n"
+        headers = {"Content-Length": "1000"}
+
+        def close(self):
+            pass
+
+    requested = []
+
+    def request(url, **kwargs):
+        requested.append(url)
+        if "google" in url:
+            raise requests.ConnectionError("Name or service not known")
+        return Response()
+
+    monkeypatch.setattr(herbie.core.session, "head", request)
+    monkeypatch.setattr(herbie.core.session, "get", request)
+    monkeypatch.setattr(_probe_cache, "get", lambda url, **kw: None)
+    monkeypatch.setattr(_probe_cache, "put", lambda url, found: None)
+
+    H = Herbie(
+        "2024-01-01", model="hrrr", priority=["google", "aws"], save_dir=tmp_path
+    )
+    assert H.grib_source == "aws"
+    assert H.idx_source == "aws"
+
+    # Sources after the first one with the file aren't checked.
+    requested.clear()
+    H = Herbie(
+        "2024-01-01", model="hrrr", priority=["aws", "google"], save_dir=tmp_path
+    )
+    assert H.grib_source == "aws"
+    assert not any("google" in url for url in requested)
+
+
+def test_template_runs_once(monkeypatch):
+    """Test that the template runs once when the default product is known."""
+    import herbie.core
+    from herbie.models import gfs
+
+    monkeypatch.setattr(Herbie, "find_grib", lambda self: (None, None))
+    monkeypatch.setattr(Herbie, "find_idx", lambda self: (None, None))
+    monkeypatch.setattr(herbie.core, "_default_products", {})
+
+    calls = []
+    template = gfs.template
+    monkeypatch.setattr(
+        gfs, "template", lambda self: calls.append(self.product) or template(self)
+    )
+
+    H = Herbie("2024-01-01", model="gfs")
+    assert calls == [None, "pgrb2.0p25"]
+
+    calls.clear()
+    H = Herbie("2024-01-01", model="gfs")
+    assert calls == ["pgrb2.0p25"]
+    assert H.SOURCES == Herbie("2024-01-01", model="gfs", product="pgrb2.0p25").SOURCES
+
+    # A wrong guess still gives the template's first product.
+    calls.clear()
+    H = Herbie("2020-01-01", model="gfs")
+    assert calls == ["pgrb2.0p25", "0.5-degree"]
+    assert H.product == "0.5-degree"
+
+
+def test_ping_pando_once(tmp_path, monkeypatch):
+    """Test that Pando is pinged once when looking for both files."""
+    import herbie.core
+
+    class Response:
+        ok = False
+        status_code = 404
+        headers = {}
+
+        def close(self):
+            pass
+
+    requested = []
+
+    def request(url, **kwargs):
+        requested.append(url)
+        return Response()
+
+    monkeypatch.setattr(herbie.core.session, "head", request)
+    monkeypatch.setattr(herbie.core.session, "get", request)
+    monkeypatch.setattr(_probe_cache, "get", lambda url, **kw: None)
+    monkeypatch.setattr(_probe_cache, "put", lambda url, found: None)
+
+    H = Herbie(
+        "2024-01-01",
+        model="hrrr",
+        priority=["pando", "pando2"],
+        IDX_SUFFIX=[".grib2.idx", ".idx"],
+        save_dir=tmp_path,
+    )
+    assert not H
+    assert requested.count("https://pando-rgw01.chpc.utah.edu/") == 1
+    assert sum("hrrr.t00z" in url for url in requested) == 6
+
+
+def test_cfgrib_indexpath(tmp_path, monkeypatch):
+    """Test that cfgrib index files of removed GRIB2 files are deleted."""
+    import herbie.core
+
+    monkeypatch.setattr(Herbie, "find_grib", lambda self: (None, None))
+    monkeypatch.setattr(Herbie, "find_idx", lambda self: (None, None))
+    monkeypatch.setattr(herbie.core, "_pruned_cfgrib_index_dirs", set())
+
+    H = Herbie("2024-01-01", model="hrrr", save_dir=tmp_path)
+    grib = tmp_path / "hrrr" / "20240101" / "hrrr.t00z.wrfsfcf00.grib2"
+    grib.parent.mkdir(parents=True)
+    grib.write_bytes(b"GRIB")
+
+    index_dir = tmp_path.resolve() / ".cfgrib_idx" / "hrrr" / "20240101"
+    index_dir.mkdir(parents=True)
+    kept = index_dir / f"{grib.name}.abc12.idx"
+    removed = index_dir / "subset_1234__hrrr.t00z.wrfsfcf00.grib2.abc12.idx"
+    kept.write_bytes(b"")
+    removed.write_bytes(b"")
+
+    assert H._cfgrib_indexpath(grib) == f"{index_dir / grib.name}.{{short_hash}}.idx"
+    assert kept.exists()
+    assert not removed.exists()
+
+    # Files outside the save_dir don't get an index file.
+    assert H._cfgrib_indexpath(tmp_path.parent / "other.grib2") == ""
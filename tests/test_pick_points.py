@@ -60,6 +60,27 @@ def test_pick_points_simple():
     )
 
 
+def test_pick_points_simple_weighted():
+    """Test weighted points on a very simple grid."""
+    ds = xr.Dataset(
+        {"a": (["latitude", "longitude"], [[1, 0], [0, 0]])},
+        coords={
+            "latitude": (["latitude"], [45, 46]),
+            "longitude": (["longitude"], [100, 101]),
+        },
+    )
+    point = pd.DataFrame({"latitude": [45.25], "longitude": [100.25]})
+
+    p = ds.herbie.pick_points(point, method="weighted", use_cached_tree=False)
+    assert all(
+        [
+            p.point_grid_distance.sizes["k"] == 4,
+            p.point_grid_distance.min().round(2).item() == 34.02,
+            p.a.round(4).item() == 0.4436,
+        ]
+    )
+
+
 def test_pick_points_self_points():
     """Test pick points with model's own grid points."""
     H = Herbie("2024-03-01", model="hrrr")
@@ -0,0 +1,132 @@
+"""Tests for getting the grid projection from cfgrib's GRIB keys."""
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from herbie import _projection
+
+pygrib = pytest.importorskip("pygrib")
+eccodes = pytest.importorskip("eccodes")
+
+# GRIB2 grid definition template number and keys for a small grid of
+# each type Herbie builds the projection for.
+GRIDS = {
+    "lambert": (
+        30,
+        dict(
+            shapeOfTheEarth=6,
+            Nx=4,
+            Ny=3,
+            latitudeOfFirstGridPointInDegrees=21.1,
+            longitudeOfFirstGridPointInDegrees=237.3,
+            LaDInDegrees=38.5,
+            LoVInDegrees=262.5,
+            Latin1InDegrees=38.5,
+            Latin2InDegrees=38.5,
+            DxInMetres=3000,
+            DyInMetres=3000,
+        ),
+    ),
+    "polar_stereographic": (
+        20,
+        dict(
+            shapeOfTheEarth=6,
+            Nx=4,
+            Ny=3,
+            latitudeOfFirstGridPointInDegrees=40.5,
+            longitudeOfFirstGridPointInDegrees=185.0,
+            LaDInDegrees=60,
+            orientationOfTheGridInDegrees=210,
+            DxInMetres=6000,
+            DyInMetres=6000,
+        ),
+    ),
+    "mercator": (
+        10,
+        dict(
+            shapeOfTheEarth=1,
+            scaleFactorOfRadiusOfSphericalEarth=0,
+            scaledValueOfRadiusOfSphericalEarth=6371200,
+            Ni=4,
+            Nj=3,
+            latitudeOfFirstGridPointInDegrees=18.0,
+            longitudeOfFirstGridPointInDegrees=198.0,
+            latitudeOfLastGridPointInDegrees=23.0,
+            longitudeOfLastGridPointInDegrees=206.0,
+            LaDInDegrees=20,
+            DiInMetres=2500,
+            DjInMetres=2500,
+        ),
+    ),
+    "regular_ll": (
+        0,
+        dict(
+            shapeOfTheEarth=6,
+            Ni=4,
+            Nj=3,
+            latitudeOfFirstGridPointInDegrees=50.0,
+            longitudeOfFirstGridPointInDegrees=0.0,
+            latitudeOfLastGridPointInDegrees=48.0,
+            longitudeOfLastGridPointInDegrees=3.0,
+            iDirectionIncrementInDegrees=1.0,
+            jDirectionIncrementInDegrees=1.0,
+        ),
+    ),
+}
+
+
+def make_grib(path, template, keys):
+    """Write a GRIB2 file with one message on a 4x3 grid."""
+    h = eccodes.codes_grib_new_from_samples("GRIB2")
+    eccodes.codes_set(h, "gridDefinitionTemplateNumber", template)
+    for key, value in keys.items():
+        eccodes.codes_set(h, key, value)
+    eccodes.codes_set(h, "numberOfDataPoints", 12)
+    eccodes.codes_set_values(h, np.arange(12, dtype=float))
+    with open(path, "wb") as f:
+        eccodes.codes_write(h, f)
+    eccodes.codes_release(h)
+    return path
+
+
+@pytest.mark.parametrize("grid_type", GRIDS)
+def test_projparams_from_grib_attrs(tmp_path, grid_type):
+    """Test the PROJ parameters are the same as pygrib's."""
+    path = make_grib(tmp_path / f"{grid_type}.grib2", *GRIDS[grid_type])
+    ds = xr.open_dataset(
+        path,
+        engine="cfgrib",
+        backend_kwargs={"indexpath": "", "read_keys": _projection.READ_KEYS},
+    )
+    with pygrib.open(str(path)) as grbs:
+        expected = grbs.message(1).projparams
+    assert _projection.projparams_from_grib_attrs(ds) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("grid_type", GRIDS)
+def test_add_proj_info(tmp_path, monkeypatch, caplog, grid_type):
+    """Test pygrib only opens the file when the GRIB keys weren't read."""
+    from herbie.accessors import add_proj_info
+
+    path = make_grib(tmp_path / f"{grid_type}.grib2", *GRIDS[grid_type])
+    with pygrib.open(str(path)) as grbs:
+        expected = _projection.cf_params(grbs.message(1).projparams)
+
+    # The projection keys were read, so the file isn't opened again.
+    ds = xr.open_dataset(
+        path,
+        engine="cfgrib",
+        backend_kwargs={"indexpath": "", "read_keys": _projection.READ_KEYS},
+    )
+    with monkeypatch.context() as m:
+        m.setattr(pygrib, "open", None)
+        add_proj_info(ds)
+    assert ds.gribfile_projection.attrs.items() >= expected.items()
+
+    # Without the projection keys, it is read from the file with pygrib.
+    ds = xr.open_dataset(path, engine="cfgrib", backend_kwargs={"indexpath": ""})
+    with caplog.at_level("DEBUG", logger="herbie.accessors"):
+        add_proj_info(ds)
+    assert "with pygrib" in caplog.text
+    assert ds.gribfile_projection.attrs.items() >= expected.items()